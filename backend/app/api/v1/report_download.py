@@ -1,63 +1,233 @@
-import tempfile
 import os
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from anyio import to_thread
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
-from fastapi.responses import HTMLResponse, FileResponse
-from sqlalchemy.ext.asyncio import AsyncSession
-import re
+from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, Response, StreamingResponse
+import string
+import hashlib
 import logging
-from backend.app.core.logger import logger
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import Iterator
+import orjson
+from backend.app.core.logger import api_logger as logger
 from pathlib import Path
-from weasyprint import HTML
+from jinja2 import BaseLoader, Environment, select_autoescape
+from weasyprint import CSS, HTML
+from weasyprint.text.fonts import FontConfiguration
 
-from backend.app.core.config import settings
-from backend.app.db.connection import get_db
+from backend.app.core.config import Settings, get_settings
+from backend.app.core.inflight import InflightRequests
+from backend.app.db.database import get_report_repository
 from backend.app.db.repositories.report_repository import ReportRepository
 from backend.app.db.models.report_state import ReportStatusEnum
-from backend.app.security.dependencies import CurrentUser
+from backend.app.security.dependencies import resolve_current_user
 
 router = APIRouter()
 
 downloads_logger = logging.getLogger("downloads")
 
+# Characters allowed in a report_id; anything else could be used for path traversal.
+_REPORT_ID_ALLOWED = frozenset(string.ascii_letters + string.digits + "_-")
+
+def _is_valid_report_id(report_id: str) -> bool:
+    return bool(report_id) and _REPORT_ID_ALLOWED.issuperset(report_id)
+
+# WeasyPrint re-parses every stylesheet it is handed, so the base stylesheet and
+# font configuration are built once at import and shared by every PDF render.
+MINIMAL_CSS = """
+@page { size: A4; margin: 2cm; }
+body { font-family: sans-serif; font-size: 11pt; line-height: 1.4; }
+h1, h2, h3, h4 { page-break-after: avoid; }
+ul { padding-left: 1.2em; }
+"""
+FONT_CONFIG = FontConfiguration()
+BASE_CSS = [CSS(string=MINIMAL_CSS, font_config=FONT_CONFIG)]
+
+REPORT_TEMPLATE_SRC = """\
+{%- if not report -%}
+<html><body><h1>Report data not available.</h1></body></html>
+{%- else -%}
+<html><head><title>ChainReport</title></head><body>
+<h1>Report ID: {{ report.get("report_id", "N/A") }}</h1>
+{%- if "metadata" in report %}
+<h2>Metadata</h2><ul>
+{%- for key, value in report["metadata"].items() %}
+<li><strong>{{ key }}:</strong> {{ value }}</li>
+{%- endfor %}
+</ul>
+{%- endif %}
+{%- set sections = report.get("sections") %}
+{%- if sections is sequence and sections is not string and sections is not mapping %}
+<h2>Report Sections</h2>
+{%- for section in sections %}
+<h3>{{ section.get("title", "Untitled Section") }}</h3>
+{%- if "content" in section %}
+<p>{{ section["content"] }}</p>
+{%- endif %}
+{%- if "agents_output" in section %}
+<h4>Agent Outputs:</h4><ul>
+{%- for agent, output in section["agents_output"].items() %}
+<li><strong>{{ agent }}:</strong> {{ output }}</li>
+{%- endfor %}
+</ul>
+{%- endif %}
+{%- endfor %}
+{%- endif %}
+</body></html>
+{%- endif %}"""
+
+# The template is compiled once at import; autoescaping keeps report values
+# from injecting markup into the rendered page.
+_ENV = Environment(loader=BaseLoader(), autoescape=select_autoescape(["html"]))
+_REPORT_TPL = _ENV.from_string(REPORT_TEMPLATE_SRC)
+
 def render_report_html(report_data: dict) -> str:
     """
-    Renders the report JSON data into a basic HTML structure.
-    This is a simplified rendering for demonstration.
+    Renders the report JSON data into a basic HTML structure
+    using the precompiled report template.
     """
-    if not report_data:
-        return "<html><body><h1>Report data not available.</h1></body></html>"
+    return _REPORT_TPL.render(report=report_data)
 
-    html_content = "<html><head><title>ChainReport</title></head><body>"
-    html_content += f"<h1>Report ID: {report_data.get('report_id', 'N/A')}</h1>"
-    
-    # Example of rendering some common top-level fields
-    if "metadata" in report_data:
-        html_content += "<h2>Metadata</h2><ul>"
-        for key, value in report_data["metadata"].items():
-            html_content += f"<li><strong>{key}:</strong> {value}</li>"
-        html_content += "</ul>"
-
-    if "sections" in report_data and isinstance(report_data["sections"], list):
-        html_content += "<h2>Report Sections</h2>"
-        for section in report_data["sections"]:
-            html_content += f"<h3>{section.get('title', 'Untitled Section')}</h3>"
-            if "content" in section:
-                html_content += f"<p>{section['content']}</p>"
-            if "agents_output" in section:
-                html_content += "<h4>Agent Outputs:</h4><ul>"
-                for agent, output in section["agents_output"].items():
-                    html_content += f"<li><strong>{agent}:</strong> {output}</li>"
-                html_content += "</ul>"
-
-    html_content += "</body></html>"
-    return html_content
+# Rendered HTML keyed by (report_id, content hash of the report JSON), shared by
+# the /html and /pdf endpoints so a report is rendered once per content version.
+_HTML_CACHE_MAXSIZE = 256
+_HTML_CACHE: OrderedDict[tuple[str, str], str] = OrderedDict()
+# Streamed renders populate the cache from Starlette's threadpool
+_html_cache_lock = threading.Lock()
+
+def _report_content_hash(report_data: dict) -> str:
+    return hashlib.blake2b(orjson.dumps(report_data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+
+def _html_cache_get(key: tuple[str, str]) -> str | None:
+    with _html_cache_lock:
+        html = _HTML_CACHE.get(key)
+        if html is not None:
+            _HTML_CACHE.move_to_end(key)
+        return html
+
+def _html_cache_put(key: tuple[str, str], html: str) -> None:
+    with _html_cache_lock:
+        _HTML_CACHE[key] = html
+        _HTML_CACHE.move_to_end(key)
+        if len(_HTML_CACHE) > _HTML_CACHE_MAXSIZE:
+            _HTML_CACHE.popitem(last=False)
+
+def render_report_html_cached(report_id: str, report_data: dict) -> str:
+    """
+    Returns the rendered HTML for a report, rendering it only if this version
+    of the report content has not been rendered before.
+    """
+    key = (report_id, _report_content_hash(report_data))
+    html = _html_cache_get(key)
+    if html is None:
+        html = render_report_html(report_data)
+        _html_cache_put(key, html)
+    return html
+
+def _stream_and_cache(key: tuple[str, str], report_data: dict) -> Iterator[str]:
+    chunks = []
+    for chunk in render_report_html_iter(report_data):
+        chunks.append(chunk)
+        yield chunk
+    _html_cache_put(key, "".join(chunks))
+
+def render_report_html_iter(report_data: dict) -> Iterator[str]:
+    """
+    Lazily renders the report template, yielding the HTML chunk by chunk
+    so the response body can be streamed as it is produced.
+    """
+    return _REPORT_TPL.generate(report=report_data)
+
+# In-flight PDF renders keyed by report_id, so concurrent requests for the same
+# report await a single WeasyPrint render instead of each starting their own.
+_PDF_INFLIGHT = InflightRequests()
+
+# Dedicated, bounded pool for WeasyPrint so a burst of PDF renders cannot
+# saturate the default loop executor shared by the rest of the app.
+PDF_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1),
+    thread_name_prefix="weasyprint",
+)
+
+# Background PDF generation status keyed by report_id: "pending" while a render
+# is queued or running, "failed" until the next request retries it. Reports with
+# a PDF on disk are ready and have no entry.
+_PDF_STATUS: dict[str, str] = {}
+
+def _render_pdf(html_content: str, pdf_filepath: Path) -> None:
+    # Render to a temporary file and swap it in, so a half-written PDF is never
+    # mistaken for a finished one by the pdf_filepath.exists() check.
+    tmp_filepath = pdf_filepath.with_suffix(".pdf.tmp")
+    HTML(string=html_content).write_pdf(
+        tmp_filepath,
+        stylesheets=BASE_CSS,
+        font_config=FONT_CONFIG,
+        # Fonts are subset by default (full_fonts=False); also recompress images
+        # and skip the HTML presentational-hints pass, which reports do not use.
+        optimize_images=True,
+        presentational_hints=False,
+    )
+    os.replace(tmp_filepath, pdf_filepath)
+
+async def _render_pdf_job(report_id: str, report_data: dict, pdf_filepath: Path) -> Path:
+    html_content = render_report_html_cached(report_id, report_data)
+    # Offload blocking PDF generation to the dedicated PDF pool
+    await asyncio.get_running_loop().run_in_executor(PDF_EXECUTOR, _render_pdf, html_content, pdf_filepath)
+    return pdf_filepath
+
+async def _generate_pdf(report_id: str, report_data: dict, pdf_filepath: Path) -> Path:
+    """
+    Renders the report PDF to `pdf_filepath`, coalescing concurrent calls for the
+    same report_id onto the render that is already in progress. The render runs
+    as its own task, so a cancelled caller does not abort it for the others.
+    """
+    return await _PDF_INFLIGHT.run(report_id, partial(_render_pdf_job, report_id, report_data, pdf_filepath))
+
+async def _generate_pdf_in_background(report_id: str, report_data: dict, pdf_filepath: Path) -> None:
+    """
+    Background task wrapper around `_generate_pdf` that records the outcome in
+    `_PDF_STATUS` for subsequent polling requests.
+    """
+    try:
+        await _generate_pdf(report_id, report_data, pdf_filepath)
+        _PDF_STATUS.pop(report_id, None)
+        logger.info("PDF report generated for report_id: %s", report_id)
+    except Exception:
+        _PDF_STATUS[report_id] = "failed"
+        logger.exception("Failed to generate PDF report for report_id: %s", report_id, extra={"report_id": report_id})
+
+def _content_disposition(report_id: str, extension: str) -> str:
+    return f'attachment; filename="report_{report_id}.{extension}"'
+
+def _pdf_file_response(report_id: str, pdf_filepath: Path, x_accel_prefix: str | None) -> Response:
+    """
+    Builds the download response for a stored PDF. When an X-Accel prefix is
+    configured, nginx serves the file and the app only returns headers.
+    """
+    filename = f"report_{report_id}.pdf"
+    if x_accel_prefix:
+        return Response(
+            status_code=status.HTTP_200_OK,
+            headers={
+                "X-Accel-Redirect": f"{x_accel_prefix.rstrip('/')}/{filename}",
+                "Content-Type": "application/pdf",
+                "Content-Disposition": _content_disposition(report_id, "pdf"),
+            },
+        )
+    return FileResponse(
+        path=pdf_filepath,
+        media_type="application/pdf",
+        filename=filename,
+        status_code=status.HTTP_200_OK
+    )
 
 @router.get("/reports/{report_id}/html", response_class=HTMLResponse)
 async def get_report_html(
     report_id: str,
-    db_session: AsyncSession = Depends(get_db),
-    current_user: CurrentUser = Depends(CurrentUser)
+    report_repository: ReportRepository = Depends(get_report_repository)
 ):
     """
     Retrieves and serves the HTML report for a given report ID,
@@ -65,11 +235,14 @@ async def get_report_html(
     """
     # 1. Path Traversal Prevention: Sanitize report_id
     # Ensure report_id only contains alphanumeric characters, dashes, and underscores
-    if not re.fullmatch(r"^[a-zA-Z0-9_-]+$", report_id):
+    if not _is_valid_report_id(report_id):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid report ID format.")
 
-    report_repository = ReportRepository(lambda: db_session)
-    report_state = await report_repository.get_report_by_id(report_id)
+    # Authenticate the caller while the report is fetched
+    current_user, report_state = await asyncio.gather(
+        resolve_current_user(),
+        report_repository.get_report_by_id(report_id),
+    )
 
     if not report_state:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found.")
@@ -80,7 +253,7 @@ async def get_report_html(
     # For now, we'll assume a simplified check.
     # if report_state.user_id != current_user.id:
     #    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to access this report.")
-    print(f"User '{current_user.username}' (ID: {current_user.id}) is accessing report '{report_id}'.")
+    downloads_logger.info("user_access", extra={"user_id": current_user.id, "username": current_user.username, "report_id": report_id})
 
 
     # 3. Check if report status is COMPLETED
@@ -94,37 +267,46 @@ async def get_report_html(
     if not final_report_json:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Final report content not available.")
 
-    # 4. Render the JSON into a basic HTML structure
-    html_content = render_report_html(final_report_json)
-
-    # 5. Return the HTML with a Content-Disposition header for download
-    response = HTMLResponse(content=html_content, status_code=status.HTTP_200_OK)
-    response.headers["Content-Disposition"] = f"attachment; filename=\"report_{report_id}.html\""
-    return response
+    # 4. Serve the cached render if this report version was rendered before,
+    # otherwise stream it and cache it once fully rendered
+    cache_key = (report_id, _report_content_hash(final_report_json))
+    headers = {"Content-Disposition": _content_disposition(report_id, "html")}
+    cached_html = _html_cache_get(cache_key)
+    if cached_html is not None:
+        return HTMLResponse(content=cached_html, status_code=status.HTTP_200_OK, headers=headers)
+    return StreamingResponse(
+        _stream_and_cache(cache_key, final_report_json),
+        status_code=status.HTTP_200_OK,
+        media_type="text/html",
+        headers=headers,
+    )
 
 @router.get("/reports/{report_id}/pdf")
 async def get_report_pdf(
     report_id: str,
     background_tasks: BackgroundTasks,
-    db_session: AsyncSession = Depends(get_db),
-    current_user: CurrentUser = Depends(CurrentUser),
-    request: Request
+    request: Request,
+    report_repository: ReportRepository = Depends(get_report_repository),
+    settings: Settings = Depends(get_settings)
 ):
     """
     Retrieves and serves the PDF report for a given report ID,
     including authentication, authorization, and path traversal prevention.
     """
-    if not re.fullmatch(r"^[a-zA-Z0-9_-]+$", report_id):
+    if not _is_valid_report_id(report_id):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid report ID format.")
 
-    report_repository = ReportRepository(lambda: db_session)
-    report_state = await report_repository.get_report_by_id(report_id)
+    # Authenticate the caller while the report is fetched
+    current_user, report_state = await asyncio.gather(
+        resolve_current_user(),
+        report_repository.get_report_by_id(report_id),
+    )
 
     if not report_state:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found.")
 
     # Placeholder for authentication and authorization
-    print(f"User '{current_user.username}' (ID: {current_user.id}) is accessing report '{report_id}'.")
+    downloads_logger.info("user_access", extra={"user_id": current_user.id, "username": current_user.username, "report_id": report_id})
     downloads_logger.info({
         "event": "pdf_download",
         "reportId": report_id,
@@ -141,41 +323,33 @@ async def get_report_pdf(
     if not final_report_json:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Final report content not available.")
 
-    report_dir = settings.REPORT_OUTPUT_DIR
-    report_dir.mkdir(parents=True, exist_ok=True)
-    pdf_filepath = report_dir / f"report_{report_id}.pdf"
-
-    if pdf_filepath.exists():
-        logger.info(f"Serving existing PDF report for report_id: {report_id}")
-        return FileResponse(
-            path=pdf_filepath,
-            media_type="application/pdf",
-            filename=f"report_{report_id}.pdf",
-            status_code=status.HTTP_200_OK
-        )
-    
-    logger.info(f"Generating new PDF report for report_id: {report_id}")
-    html_content = render_report_html(final_report_json)
+    # REPORT_OUTPUT_DIR is created once at startup by the app lifespan hook
+    pdf_filepath = settings.REPORT_OUTPUT_DIR / f"report_{report_id}.pdf"
 
-    try:
-        # Offload blocking PDF generation to a thread pool
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            lambda: HTML(string=html_content).write_pdf(pdf_filepath)
-        )
+    # stat() off the event loop; it can block on network filesystems
+    if await to_thread.run_sync(pdf_filepath.exists):
+        logger.info("Serving existing PDF report for report_id: %s", report_id)
+        return _pdf_file_response(report_id, pdf_filepath, settings.REPORT_X_ACCEL_PREFIX)
 
-        # Return the newly generated PDF
-        response = FileResponse(
-            path=pdf_filepath,
-            media_type="application/pdf",
-            filename=f"report_{report_id}.pdf",
-            status_code=status.HTTP_200_OK
-        )
-        return response
-    except Exception as e:
-        logger.exception(f"Failed to generate PDF report for report_id: {report_id}", extra={"report_id": report_id})
+    pdf_status = _PDF_STATUS.get(report_id)
+    if pdf_status == "failed":
+        # Clear the failure so the next request queues a fresh render.
+        _PDF_STATUS.pop(report_id, None)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to generate PDF report"
-        ) from e
+        )
+
+    if pdf_status is None:
+        logger.info("Queueing PDF generation for report_id: %s", report_id)
+        _PDF_STATUS[report_id] = "pending"
+        background_tasks.add_task(_generate_pdf_in_background, report_id, final_report_json, pdf_filepath)
+
+    # The PDF is rendered off the request path; clients poll this endpoint until it returns 200.
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content={
+            "detail": "PDF report is being generated.",
+            "poll": str(request.url.path),
+        },
+    )
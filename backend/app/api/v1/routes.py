@@ -1,11 +1,10 @@
-from fastapi import APIRouter, BackgroundTasks, Depends
-from fastapi.responses import JSONResponse
-from sqlalchemy.ext.asyncio import AsyncSession
-from backend.app.db.database import get_db
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
+from backend.app.db.database import get_report_repository
 from backend.app.db.repositories.report_repository import ReportRepository
 from backend.app.models.report_models import ReportRequest, ReportResponse
 from backend.app.services.report_service import generate_report, get_report_status, get_report_data
-from backend.app.services.report_processor import process_report
+from backend.app.workers import report_worker
 from backend.app.core.logger import api_logger
 from backend.app.core.exceptions import ReportNotFoundException
 from backend.app.db.models.report_state import ReportStatusEnum
@@ -18,64 +17,66 @@ router.include_router(download_router)
 async def read_root():
     return {"message": "Welcome to API v1"}
 
-async def _run_agents_in_background(report_id: str, token_id: str):
-    async for session in get_db():
-        report_repository = ReportRepository(session)
-        try:
-            await report_repository.update_report_status(report_id, ReportStatusEnum.RUNNING_AGENTS)
-            await process_report(report_id, token_id, report_repository)
-            await report_repository.update_report_status(report_id, ReportStatusEnum.COMPLETED)
-            break  # Exit the async for loop after successful processing
-        except Exception as e:
-            api_logger.error(f"Report processing failed for report {report_id}: {e}")
-            await report_repository.update_partial(report_id, {"status": ReportStatusEnum.FAILED, "error_message": str(e)})
-            break # Exit the async for loop on failure
-
 @router.post("/report/generate", response_model=ReportResponse)
-async def generate_report_endpoint(request: ReportRequest, background_tasks: BackgroundTasks, session: AsyncSession = Depends(get_db)):
+async def generate_report_endpoint(request: ReportRequest, report_repository: ReportRepository = Depends(get_report_repository)):
     api_logger.info(f"Received report generation request for token_id: {request.token_id}")
-    report_repository = ReportRepository(session)
     report_response = await generate_report(request, report_repository)
     report_id = report_response.report_id
-    background_tasks.add_task(_run_agents_in_background, report_id, request.token_id)
+    await report_worker.enqueue("run_report_pipeline", report_id, request.token_id)
     return report_response
 
+def _status_etag(status: str) -> str:
+    # The status body is fully determined by the status value, so it doubles as the validator.
+    return f'W/"{status}"'
+
 @router.get("/reports/{report_id}/status")
-async def get_report_status_endpoint(report_id: str, session: AsyncSession = Depends(get_db)):
+async def get_report_status_endpoint(report_id: str, request: Request, report_repository: ReportRepository = Depends(get_report_repository)):
     api_logger.info(f"Received status request for report_id: {report_id}")
-    report_repository = ReportRepository(session)
     report = await get_report_status(report_id, report_repository)
     if not report:
         api_logger.error(f"Report with id {report_id} not found for status request.")
         raise ReportNotFoundException(detail="Report not found")
-    return {"report_id": report_id, "status": report["status"]}
+    headers = {"ETag": _status_etag(report["status"]), "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and headers["ETag"] in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse({"report_id": report_id, "status": report["status"]}, headers=headers)
+
+_PROCESSING_STATUSES = frozenset(
+    status.value
+    for status in (
+        ReportStatusEnum.PENDING,
+        ReportStatusEnum.RUNNING_AGENTS,
+        ReportStatusEnum.GENERATING_NLG,
+        ReportStatusEnum.GENERATING_SUMMARY,
+    )
+)
 
-@router.get("/reports/{report_id}/data")
-async def get_report_data_endpoint(report_id: str, session: AsyncSession = Depends(get_db)):
+@router.get("/reports/{report_id}/data", response_class=ORJSONResponse)
+async def get_report_data_endpoint(report_id: str, report_repository: ReportRepository = Depends(get_report_repository)):
     api_logger.info(f"Received data request for report_id: {report_id}")
-    report_repository = ReportRepository(session)
     report_result = await get_report_data(report_id, report_repository)
-    if report_result:
-        if report_result.get("status") == ReportStatusEnum.COMPLETED.value:
-            api_logger.info(f"Returning data for report_id: {report_id}")
-            return report_result
-        elif report_result.get("status") == ReportStatusEnum.RUNNING_AGENTS.value or report_result.get("status") == ReportStatusEnum.PENDING.value or report_result.get("status") == ReportStatusEnum.RUNNING_AGENTS.value or report_result.get("status") == ReportStatusEnum.GENERATING_NLG.value or report_result.get("status") == ReportStatusEnum.GENERATING_SUMMARY.value:
-            api_logger.warning(f"Report {report_id} is still processing.")
-            return JSONResponse(
-                status_code=202,
-                content={
-                    "detail": "Report is still processing.",
-                },
-            )
-        elif report_result.get("status") == ReportStatusEnum.FAILED.value:
-            api_logger.error(f"Report {report_id} failed with detail: {report_result.get('detail', 'N/A')}")
-            return JSONResponse(
-                status_code=409,
-                content={
-                    "report_id": report_id,
-                    "message": "Report failed",
-                    "detail": report_result.get('detail', 'Report processing failed.'),
-                },
-            )
+    report_status = report_result.get("status") if report_result else None
+    if report_status == ReportStatusEnum.COMPLETED.value:
+        api_logger.info(f"Returning data for report_id: {report_id}")
+        return report_result
+    if report_status in _PROCESSING_STATUSES:
+        api_logger.warning(f"Report {report_id} is still processing.")
+        return ORJSONResponse(
+            status_code=202,
+            content={
+                "detail": "Report is still processing.",
+            },
+        )
+    if report_status == ReportStatusEnum.FAILED.value:
+        api_logger.error(f"Report {report_id} failed with detail: {report_result.get('detail', 'N/A')}")
+        return ORJSONResponse(
+            status_code=409,
+            content={
+                "report_id": report_id,
+                "message": "Report failed",
+                "detail": report_result.get('detail', 'Report processing failed.'),
+            },
+        )
     api_logger.error(f"Report with id {report_id} not found or not completed for data request.")
     raise ReportNotFoundException(detail="Report not found or not completed")
@@ -1,54 +1,67 @@
-import redis
-import threading
 import logging
+import orjson
+from redis.asyncio import ConnectionPool, Redis
 from redis.exceptions import RedisError
 from backend.app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-class RedisClient:
-    _instance = None
-    _lock = threading.Lock()
+_pool: ConnectionPool | None = None
 
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super(RedisClient, cls).__new__(cls)
-                    cls._instance.client = cls._instance._initialize_redis_client()
-        return cls._instance
 
-    def _initialize_redis_client(self):
-        try:
-            client = redis.Redis(
-                host=settings.REDIS_HOST,
-                port=settings.REDIS_PORT,
-                db=settings.REDIS_DB,
-                password=settings.REDIS_PASSWORD,
-                decode_responses=True
-            )
-            client.ping()
-        except RedisError:
-            logger.warning("Redis unavailable, caching disabled", exc_info=True)
-            return None
-        else:
-            return client
+def get_redis_pool() -> ConnectionPool:
+    """
+    Returns the process-wide Redis connection pool, creating it on first use.
+    Creating the pool performs no I/O; connections are opened lazily and are
+    shared by every client in the process. Responses are returned as raw bytes,
+    which orjson parses directly.
+    """
+    global _pool
+    if _pool is None:
+        _pool = ConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            password=settings.REDIS_PASSWORD,
+            max_connections=settings.REDIS_MAX_CONNECTIONS
+        )
+    return _pool
+
+
+async def close_redis_pool():
+    global _pool
+    if _pool is not None:
+        await _pool.aclose()
+        _pool = None
+
+
+class RedisClient:
+    def __init__(self, client: Redis | None = None):
+        self._client = client
 
-    def set_cache(self, key: str, value: str, ttl: int = 3600):
+    @property
+    def client(self) -> Redis:
+        if self._client is None:
+            self._client = Redis(connection_pool=get_redis_pool())
+        return self._client
+
+    async def set_cache(self, key: str, value: dict | str | bytes, ttl: int = 3600):
         """
         Sets a key-value pair in Redis cache with an optional time-to-live (TTL).
         :param key: The key to store the value under.
-        :param value: The value to store.
+        :param value: The value to store. Dicts are serialized with orjson.
         :param ttl: Time-to-live in seconds. Defaults to 1 hour.
         """
         if not self.client:
             return
+        if isinstance(value, dict):
+            value = orjson.dumps(value)
         try:
-            self.client.setex(key, ttl, value)
+            await self.client.setex(key, ttl, value)
         except RedisError:
             logger.warning("Error setting cache for key %s", key, exc_info=True)
 
-    def get_cache(self, key: str):
+    async def get_cache(self, key: str):
         """
         Retrieves a value from Redis cache.
         :param key: The key to retrieve the value for.
@@ -57,12 +70,12 @@ class RedisClient:
         if not self.client:
             return None
         try:
-            return self.client.get(key)
+            return await self.client.get(key)
         except RedisError:
             logger.warning("Error getting cache for key %s", key, exc_info=True)
         return None
 
-    def delete_cache(self, key: str):
+    async def delete_cache(self, key: str):
         """
         Deletes a key-value pair from Redis cache.
         :param key: The key to delete.
@@ -70,8 +83,22 @@ class RedisClient:
         if not self.client:
             return
         try:
-            self.client.delete(key)
+            await self.client.delete(key)
         except RedisError:
             logger.warning("Error deleting cache for key %s", key, exc_info=True)
 
+    async def pop_cache(self, key: str):
+        """
+        Retrieves and deletes a value from Redis cache in a single round trip (GETDEL).
+        :param key: The key to retrieve and remove.
+        :return: The value that was stored, or None if not found or an error occurs.
+        """
+        if not self.client:
+            return None
+        try:
+            return await self.client.getdel(key)
+        except RedisError:
+            logger.warning("Error popping cache for key %s", key, exc_info=True)
+        return None
+
 redis_client = RedisClient()
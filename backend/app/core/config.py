@@ -1,4 +1,6 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from pathlib import Path
 from typing import Dict, List
 
 
@@ -16,13 +18,20 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: str | None = None
+    REDIS_MAX_CONNECTIONS: int = 64
+    REDIS_CACHE_TTL: int = 3600
     USER_AGENT: str = "ChainReport-API/1.0 (https://lumintelanalytics.com)"
     REQUEST_DELAY_SECONDS: float = 1.0
+    MAX_CONCURRENT_REQUESTS_PER_HOST: int = 4
     MAX_RETRIES: int = 5
     RETRY_MULTIPLIER: float = 1.0
     MIN_RETRY_DELAY: float = 1.0
     MAX_RETRY_DELAY: float = 60.0
     AGENT_TIMEOUT: float = 30.0
+    MAX_CONCURRENT_AGENTS: int = 4
+    AGENT_MAX_RETRIES: int = 3
+    AGENT_CACHE_TTL: float = 60.0
+    TEAM_DOC_WORKERS: int = 8
     TEAM_PROFILE_URLS: Dict[str, List[str]] = {}
     WHITEPAPER_TEXT_SOURCES: Dict[str, str] = {}
     CODE_AUDIT_REPO_URL: str | None = None
@@ -52,8 +61,20 @@ class Settings(BaseSettings):
 
     BASE_DIR: Path = Path(__file__).parent.parent.parent
     REPORT_OUTPUT_DIR: Path = BASE_DIR / "storage" / "reports"
+    # Internal nginx location aliased to REPORT_OUTPUT_DIR. When set, stored reports
+    # are handed off to nginx via X-Accel-Redirect instead of being streamed by the app.
+    REPORT_X_ACCEL_PREFIX: str | None = None
 
-    model_config = SettingsConfigDict(env_file=".env")
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Returns the process-wide Settings, reading `.env` and validating fields only
+    once. Use as a FastAPI dependency so tests can override it.
+    """
+    return Settings()
+
+
+settings = get_settings()
@@ -1,5 +1,6 @@
 import logging
 import traceback
+import orjson
 from typing import Dict, Any
 
 from backend.app.core.config import settings
@@ -12,7 +13,7 @@ def capture_exception(e: Exception, context: Dict[str, Any]) -> Dict[str, Any]:
     returning a standardized error format.
     Stack trace verbosity is controlled solely by `settings.DEBUG`.
     Full stack traces are provided when `settings.DEBUG` is `True`,
-    and truncated to the last 5 lines when `settings.DEBUG` is `False`.
+    and limited to the innermost 5 frames when `settings.DEBUG` is `False`.
 
     Args:
         e: The exception object.
@@ -28,37 +29,23 @@ def capture_exception(e: Exception, context: Dict[str, Any]) -> Dict[str, Any]:
     """
     error_type = type(e).__name__
     message = str(e)
-    full_stack_trace = "".join(traceback.format_exception(type(e), e, e.__traceback__)) if e.__traceback__ else "No stack trace available."
-    
-    stack_trace = full_stack_trace
-    log_level = logger.error
-
-    if not settings.DEBUG:  # Assuming DEBUG is False for production
-        # Truncate stack trace for production environments
-        lines = full_stack_trace.splitlines()
-        if len(lines) > 5:  # Keep last 5 lines for brevity in production
-            stack_trace = "\n".join(lines[-5:])
-        
-        # Log less verbosely in production
-        log_level = logger.warning
-        log_message = f"Exception captured: {error_type} - {message}. Context: {context}. Stack Trace (truncated):\n{stack_trace}"
+    if e.__traceback__:
+        # In production only the innermost 5 frames are formatted at all.
+        limit = None if settings.DEBUG else -5
+        stack_trace = "".join(traceback.format_exception(type(e), e, e.__traceback__, limit=limit))
     else:
-        log_message = f"Exception captured: {error_type} - {message}. Context: {context}. Stack Trace:\n{stack_trace}"
-    
-    log_level(log_message)
+        stack_trace = "No stack trace available."
+
+    # Log less verbosely in production
+    log_level = logging.ERROR if settings.DEBUG else logging.WARNING
+    if logger.isEnabledFor(log_level):
+        trace_label = "Stack Trace" if settings.DEBUG else "Stack Trace (truncated)"
+        logger.log(log_level, "Exception captured: %s - %s. Context: %s. %s:\n%s", error_type, message, context, trace_label, stack_trace)
+
+    # Sanitize context to ensure all values are JSON-serializable: a single orjson
+    # round trip, where `default=str` is only invoked for values it cannot encode.
+    sanitized_context = orjson.loads(orjson.dumps(context, default=str, option=orjson.OPT_NON_STR_KEYS))
 
-    # Sanitize context to ensure all values are JSON-serializable
-    sanitized_context = {}
-    import json # Import json inside the function to avoid global import if not always needed
-    for key, value in context.items():
-        try:
-            # Attempt to serialize to JSON to check if it's serializable
-            json.dumps(value)
-            sanitized_context[key] = value
-        except (TypeError, OverflowError):
-            # If not serializable, convert to string representation
-            sanitized_context[key] = str(value)
-    
     # Use the sanitized_context for the standardized error
     standardized_error = {
         "error_type": error_type,
@@ -0,0 +1,35 @@
+import httpx
+from backend.app.core.config import settings
+
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Returns the process-wide outbound HTTP client, creating it on first use.
+    Agents share it so upstream calls reuse pooled keep-alive (and HTTP/2)
+    connections instead of paying a TCP/TLS handshake per request.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=settings.AGENT_TIMEOUT,
+            headers={"User-Agent": settings.USER_AGENT},
+            limits=HTTP_LIMITS,
+        )
+    return _client
+
+
+async def close_http_client():
+    """
+    Closes the shared client on process shutdown. Agents and clients that borrow
+    it through get_http_client() only drop their reference when they are done;
+    none of them close it.
+    """
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,68 @@
+import asyncio
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class InflightRequests:
+    """
+    Coalesces concurrent calls that share a key into a single upstream call.
+
+    The first caller for a key starts the work as its own task; callers that
+    arrive while it is still running await the same task instead of issuing a
+    duplicate request. Each caller awaits through `asyncio.shield`, so one caller
+    being cancelled (e.g. by its report's deadline) does not cancel the call for
+    the others.
+
+    With a positive `ttl`, a successful result is also kept for that many
+    seconds (up to `max_entries` keys, least recently used first out), so calls
+    shortly after it completes are answered without going upstream at all.
+    Failures are never cached. Callers whose fetches degrade to a fallback value
+    instead of raising pass `cache_if` to keep those results out of the cache too.
+    """
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._tasks: Dict[Hashable, asyncio.Future] = {}
+        self._results: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    async def run(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[T]],
+        ttl: float = 0,
+        cache_if: Callable[[T], bool] | None = None,
+    ) -> T:
+        if ttl > 0:
+            entry = self._results.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._results.move_to_end(key)
+                    return entry[1]
+                del self._results[key]
+
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._tasks[key] = task
+            task.add_done_callback(partial(self._forget, key))
+        result = await asyncio.shield(task)
+
+        if ttl > 0 and (cache_if is None or cache_if(result)):
+            self._results[key] = (time.monotonic() + ttl, result)
+            self._results.move_to_end(key)
+            if len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+        return result
+
+    def _forget(self, key: Hashable, task: asyncio.Future):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled.
+            task.exception()
+
+
+inflight_requests = InflightRequests()
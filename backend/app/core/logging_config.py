@@ -1,30 +1,83 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import time
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
-import json
-from datetime import datetime
-
-class StructuredLogger(logging.Logger):
-    def _log(self, level, msg, args, exc_info=None, extra=None, stack_info=False, stacklevel=1):
-        if extra is None:
-            extra = {}
-        
-        # Ensure timestamp is always present and formatted correctly
-        extra['timestamp'] = datetime.utcnow().isoformat() + 'Z'
-
-        if isinstance(msg, dict):
-            # If the message is already a dict, merge it with extra
-            log_entry = {**msg, **extra}
+import orjson
+
+# Attributes every LogRecord carries; anything else on a record was passed via `extra`.
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_configured = False
+
+# The report being processed by the current task. Set once where a report's work
+# starts; asyncio copies the context into every task spawned from there.
+report_id_var: ContextVar[str | None] = ContextVar("report_id", default=None)
+token_id_var: ContextVar[str | None] = ContextVar("token_id", default=None)
+
+
+def set_report_context(report_id: str, token_id: str):
+    """Tags every record logged from the current task (and tasks it spawns) with the report."""
+    report_id_var.set(report_id)
+    token_id_var.set(token_id)
+
+
+class ReportContextFilter(logging.Filter):
+    """Copies the current report context onto records that don't carry it already."""
+    def filter(self, record):
+        report_id = report_id_var.get()
+        if report_id is not None and not hasattr(record, "report_id"):
+            record.report_id = report_id
+            record.token_id = token_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Serializes each record to a single JSON line with orjson. Dict messages are
+    used as the payload directly and `extra` fields are merged in, so every
+    record is serialized exactly once. The timestamp comes from `record.created`,
+    with the per-second prefix cached across records.
+    """
+    def __init__(self):
+        super().__init__()
+        self._ts_cache = (-1, "")
+
+    def _timestamp(self, created: float) -> str:
+        seconds = int(created)
+        cached_second, prefix = self._ts_cache
+        if cached_second != seconds:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+            self._ts_cache = (seconds, prefix)
+        return f"{prefix}.{int((created - seconds) * 1_000_000):06d}Z"
+
+    def format(self, record):
+        if isinstance(record.msg, dict):
+            log_entry = dict(record.msg)
         else:
-            # Otherwise, create a new dict with 'message' and extra
-            log_entry = {'message': msg, **extra}
-        
-        # Format the log entry as JSON
-        json_message = json.dumps(log_entry)
-        super()._log(level, json_message, args, exc_info, None, stack_info, stacklevel)
+            log_entry = {"message": record.getMessage()}
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                log_entry[key] = value
+
+        log_entry.update({
+            "timestamp": self._timestamp(record.created),
+            "level": record.levelname,
+            "logger": record.name,
+            "pathname": record.pathname,
+            "lineno": record.lineno,
+            "funcName": record.funcName
+        })
+
+        if record.exc_info:
+            log_entry["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            log_entry["stack_info"] = self.formatStack(record.stack_info)
+
+        return orjson.dumps(log_entry, default=str).decode()
 
-# Set the custom logger class
-logging.setLoggerClass(StructuredLogger)
 
 def configure_logging(log_dir="logs", max_bytes=10*1024*1024, backup_count=5):
     """
@@ -37,77 +90,68 @@ def configure_logging(log_dir="logs", max_bytes=10*1024*1024, backup_count=5):
         max_bytes (int): The maximum size of a log file before rotation (in bytes).
         backup_count (int): The number of backup log files to keep.
     """
+    global _configured
+    # Configure once per process: repeated calls must not stack another set of
+    # handlers (and listener threads) that would emit every record again.
+    if _configured:
+        return
+    _configured = True
+
     os.makedirs(log_dir, exist_ok=True)
 
     # Base logger
     logger = logging.getLogger()
     logger.setLevel(logging.DEBUG)  # Set the lowest level to capture all
-
-    if logger.handlers:
-        return
-    # Define a custom formatter for JSON output
-    class JsonFormatter(logging.Formatter):
-        def format(self, record):
-            try:
-                # Attempt to parse the message as JSON if it's a string
-                log_entry = json.loads(record.getMessage())
-            except json.JSONDecodeError:
-                # If not JSON, treat it as a simple message
-                log_entry = {"message": record.getMessage()}
-
-            # Add standard record attributes
-            log_entry.update({
-                "level": record.levelname,
-                "logger": record.name,
-                "pathname": record.pathname,
-                "lineno": record.lineno,
-                "funcName": record.funcName
-            })
-            
-            # Add exception info if present
-            if record.exc_info:
-                log_entry["exc_info"] = self.formatException(record.exc_info)
-            if record.stack_info:
-                log_entry["stack_info"] = self.formatStack(record.stack_info)
-            
-            return json.dumps(log_entry)
-
+    # Records are formatted once by the QueueHandler (JSON, exceptions included)
+    # and written to disk by a background listener thread, so logging from a
+    # request handler never blocks on file I/O. The listener's handlers write the
+    # prepared line as-is.
     json_formatter = JsonFormatter()
 
     # --- Debug Log Handler ---
     debug_log_path = os.path.join(log_dir, "debug.log")
     debug_handler = RotatingFileHandler(debug_log_path, maxBytes=max_bytes, backupCount=backup_count)
     debug_handler.setLevel(logging.DEBUG)
-    debug_handler.setFormatter(json_formatter)
-    logger.addHandler(debug_handler)
 
     # --- Info Log Handler ---
     info_log_path = os.path.join(log_dir, "info.log")
     info_handler = RotatingFileHandler(info_log_path, maxBytes=max_bytes, backupCount=backup_count)
     info_handler.setLevel(logging.INFO)
-    info_handler.setFormatter(json_formatter)
-    logger.addHandler(info_handler)
 
     # --- Error Log Handler ---
     error_log_path = os.path.join(log_dir, "error.log")
     error_handler = RotatingFileHandler(error_log_path, maxBytes=max_bytes, backupCount=backup_count)
     error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(json_formatter)
-    logger.addHandler(error_handler)
 
     # Optional: Console handler for development
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(json_formatter) # Use JSON formatter for console as well
-    logger.addHandler(console_handler)
+
+    logger.addHandler(_start_queue_listener(json_formatter, debug_handler, info_handler, error_handler, console_handler))
 
     # --- Downloads Log Handler ---
     downloads_log_path = os.path.join(log_dir, "downloads.log")
     downloads_handler = RotatingFileHandler(downloads_log_path, maxBytes=max_bytes, backupCount=backup_count)
     downloads_handler.setLevel(logging.INFO)
-    downloads_handler.setFormatter(json_formatter)
-    # Create a specific logger for downloads
+    # Create a specific logger for downloads with its own queue, since its records
+    # are kept out of the root handlers.
     downloads_logger = logging.getLogger("downloads")
-    downloads_logger.addHandler(downloads_handler)
+    downloads_logger.addHandler(_start_queue_listener(json_formatter, downloads_handler))
     downloads_logger.propagate = False # Prevent logs from going to the root logger
 
+
+def _start_queue_listener(formatter: logging.Formatter, *handlers: logging.Handler) -> QueueHandler:
+    """
+    Starts a background QueueListener feeding `handlers` and returns the
+    QueueHandler that enqueues records for it. The listener is stopped, and
+    its queue flushed, at interpreter exit.
+    """
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(formatter)
+    # Handler filters run in the emitting task, where the report context is visible.
+    queue_handler.addFilter(ReportContextFilter())
+    return queue_handler
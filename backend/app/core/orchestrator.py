@@ -1,18 +1,93 @@
 import asyncio
-from typing import Callable, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Awaitable, Callable, Dict, Any, Iterable, Iterator, List, Mapping, Tuple, Type
 from urllib.parse import urlparse
+import httpx
+from tenacity import AsyncRetrying, RetryCallState, retry_if_exception_type, stop_after_attempt, wait_exponential, wait_random
 from backend.app.core.logger import orchestrator_logger
+from backend.app.core.logging_config import set_report_context
 from backend.app.services.agents.onchain_agent import fetch_onchain_metrics, fetch_tokenomics
 from backend.app.services.agents.social_sentiment_agent import SocialSentimentAgent
 from backend.app.services.agents.team_doc_agent import TeamDocAgent
-from backend.app.services.agents.code_audit_agent import CodeAuditAgent
+from backend.app.services.agents.code_audit_agent import CodeAuditAgent, CodeMetrics
 from backend.app.core.config import settings
 from backend.app.db.repositories.report_repository import ReportRepository
 from backend.app.core.error_utils import capture_exception
+from backend.app.core.inflight import inflight_requests
 from backend.app.db.models.report_state import ReportStatusEnum
 from sqlalchemy.ext.asyncio import AsyncSession
 from backend.app.db.database import AsyncSessionLocal
 
+# Team/doc scraping is blocking work; a dedicated pool keeps it from queueing
+# behind (or starving) every other asyncio.to_thread call in the process.
+_team_doc_executor = ThreadPoolExecutor(max_workers=settings.TEAM_DOC_WORKERS, thread_name_prefix="teamdoc")
+
+async def _guarded_fetch(awaitable: Awaitable[Dict[str, Any]], timeout: float, label: str, report_id: str) -> Dict[str, Any]:
+    """
+    Awaits one sub-fetch under its own timeout, turning a timeout or error into a
+    failed-status payload so sibling fetches in the same gather are unaffected.
+    """
+    try:
+        async with asyncio.timeout(timeout):
+            return await awaitable
+    except TimeoutError:
+        orchestrator_logger.error("%s fetch timed out for report %s", label, report_id)
+        return {"status": "failed", "error": f"{label} fetch timed out"}
+    except Exception as e:
+        orchestrator_logger.error("%s fetch failed for report %s", label, report_id)
+        return {"status": "failed", "error": str(e)}
+
+# The social and code-audit fetches log upstream errors and fall back to empty
+# data instead of raising; these predicates keep such fallbacks out of the TTL
+# cache so the next report retries upstream.
+_SOCIAL_SOURCES = frozenset({"twitter", "reddit", "news"})
+
+def _has_all_social_sources(social_data: List[Dict[str, Any]]) -> bool:
+    return _SOCIAL_SOURCES.issubset(item.get("source") for item in social_data)
+
+def _has_repo_metrics(code_metrics: CodeMetrics) -> bool:
+    return code_metrics != CodeMetrics(repo_url=code_metrics.repo_url)
+
+async def _fetch_repo_metrics(repo_url: str):
+    # Coalesced fetches are shared across reports and can outlive whichever caller
+    # started them, so each one owns its agent instead of borrowing a caller's.
+    async with CodeAuditAgent() as agent:
+        return await agent.fetch_repo_metrics(repo_url)
+
+async def _search_audit_reports(repo_url: str):
+    async with CodeAuditAgent() as agent:
+        return await agent.search_and_summarize_audit_reports(repo_url)
+
+# Failures worth another attempt: timeouts and dropped or refused connections.
+# Agents let these propagate so the retry policy set in register_agent sees them.
+TRANSIENT_AGENT_ERRORS: Tuple[Type[BaseException], ...] = (TimeoutError, ConnectionError, httpx.TransportError)
+
+def _log_agent_retry(retry_state: RetryCallState) -> None:
+    orchestrator_logger.warning(
+        "Agent call failed (attempt %s), retrying in %.2fs: %s",
+        retry_state.attempt_number,
+        retry_state.next_action.sleep if retry_state.next_action else 0.0,
+        retry_state.outcome.exception() if retry_state.outcome else None,
+    )
+
+def _with_retry(agent_func: Callable, max_retries: int, retry_on: Tuple[Type[BaseException], ...]) -> Callable:
+    """
+    Wraps an agent so transient failures in `retry_on` are retried up to
+    `max_retries` times with jittered exponential backoff. Anything else, or the
+    last failure, propagates to the orchestrator unchanged.
+    """
+    retrying = AsyncRetrying(
+        stop=stop_after_attempt(max_retries + 1),
+        wait=wait_exponential(multiplier=settings.RETRY_MULTIPLIER, min=settings.MIN_RETRY_DELAY, max=settings.MAX_RETRY_DELAY)
+        + wait_random(0, settings.RETRY_MULTIPLIER),
+        retry=retry_if_exception_type(retry_on),
+        reraise=True,
+        before_sleep=_log_agent_retry,
+    )
+    return retrying.wraps(agent_func)
+
 async def dummy_agent(report_id: str, token_id: str) -> Dict[str, Any]:
     """
     A dummy agent for testing purposes.
@@ -26,44 +101,89 @@ class Orchestrator:
     Concrete implementation of AIOrchestrator.
     Instances of Orchestrator should be created using the `create_orchestrator` factory function.
     """
+    __slots__ = ("_agents", "_agent_pairs", "report_repository")
+
     def __init__(self, session_factory: Callable[..., AsyncSession]):
         self._agents: Dict[str, Callable] = {}
+        # Registration only happens while the orchestrator is being built, so the
+        # hot path iterates this snapshot instead of re-walking the dict.
+        self._agent_pairs: Tuple[Tuple[str, Callable], ...] = ()
         self.report_repository = ReportRepository(session_factory)
 
-    def register_agent(self, name: str, agent_func: Callable):
-        self._agents[name] = agent_func
+    def register_agent(
+        self,
+        name: str,
+        agent_func: Callable,
+        max_retries: int = 0,
+        retry_on: Tuple[Type[BaseException], ...] = TRANSIENT_AGENT_ERRORS,
+    ):
+        """
+        Registers `agent_func` under `name`. With `max_retries` > 0 the agent is
+        retried on the exception types in `retry_on`; retries still count against
+        the run's AGENT_TIMEOUT deadline.
+        """
+        if name in self._agents:
+            orchestrator_logger.debug("Agent %s is already registered, skipping.", name)
+            return
+        self._agents[name] = _with_retry(agent_func, max_retries, retry_on) if max_retries > 0 else agent_func
+        self._agent_pairs = tuple(self._agents.items())
+
+    async def _agent_worker(self, pending: Iterator[Tuple[str, Callable]], results: Dict[str, Any], report_id: str, token_id: str):
+        for agent_name, agent_func in pending:
+            try:
+                results[agent_name] = await agent_func(report_id, token_id)
+            except Exception as e:
+                # Reported as soon as the agent fails, without waiting on slower peers.
+                orchestrator_logger.exception("Agent %s failed for report %s", agent_name, report_id)
+                capture_exception(e, {"agent_name": agent_name, "report_id": report_id, "token_id": token_id})
+                results[agent_name] = e
+
+    async def execute_agents_concurrently(self, report_id: str, token_id: str, num_workers: int | None = None) -> Dict[str, Any]:
+        """
+        Runs the registered agents on a TaskGroup of `num_workers` workers (defaults
+        to MAX_CONCURRENT_AGENTS) that share one iterator over the registry, so at
+        most that many agents hit upstream APIs at once. The whole run is bounded
+        by a single AGENT_TIMEOUT deadline; agents still pending when it expires
+        are reported as timed out while finished ones keep their results.
+        """
+        if num_workers is None:
+            num_workers = settings.MAX_CONCURRENT_AGENTS
+        pending = iter(self._agent_pairs)
+        results: Dict[str, Any] = {}
+        try:
+            # The TaskGroup guarantees every worker is cancelled and awaited if the
+            # deadline fires or this call itself is cancelled; workers never raise.
+            async with asyncio.timeout(settings.AGENT_TIMEOUT), asyncio.TaskGroup() as workers:
+                for _ in range(max(1, min(num_workers, len(self._agent_pairs)))):
+                    workers.create_task(self._agent_worker(pending, results, report_id, token_id))
+        except TimeoutError:
+            orchestrator_logger.error("Agents for report %s exceeded the %ss deadline", report_id, settings.AGENT_TIMEOUT)
 
-    async def execute_agents(self, report_id: str, token_id: str) -> Dict[str, Any]:
-        tasks = {
-            name: agent_func(report_id, token_id)
-            for name, agent_func in self._agents.items()
-        }
-        
-        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
-        
         processed_results = {}
         errors_flag: Dict[str, bool] = {}
-        for agent_name, result in zip(tasks.keys(), results):
-            if isinstance(result, Exception):
-                orchestrator_logger.exception("Agent %s failed for report %s", agent_name, report_id)
+        for agent_name, _ in self._agent_pairs:
+            if agent_name in results:
+                result = results[agent_name]
+            else:
+                result = asyncio.TimeoutError(f"Agent {agent_name} did not finish before the deadline")
+                orchestrator_logger.error("Agent %s timed out for report %s", agent_name, report_id)
                 capture_exception(result, {"agent_name": agent_name, "report_id": report_id, "token_id": token_id})
+            if isinstance(result, Exception):
                 errors_flag[agent_name] = True
-                processed_results[agent_name] = {"status": "failed", "error": str(result)}
+                processed_results[agent_name] = {"status": "failed", "error": str(result) or type(result).__name__}
             else:
                 processed_results[agent_name] = result
         
+        existing_report = await self.report_repository.get_report_by_id(report_id)
         if errors_flag:
-            existing_report = await self.report_repository.get_report_by_id(report_id)
             if existing_report:
-                existing_errors = existing_report.errors if existing_report.errors else {}
                 await self.report_repository.update_partial(
                     report_id,
-                    {"status": ReportStatusEnum.AGENTS_FAILED, "errors": {**existing_errors, **errors_flag}}
+                    {"status": ReportStatusEnum.AGENTS_FAILED, "errors": {**(existing_report.errors or {}), **errors_flag}}
                 )
             else:
                 raise RuntimeError(f"Report {report_id} not found when attempting to update with agent errors. Errors detected: {errors_flag}")
         else:
-            existing_report = await self.report_repository.get_report_by_id(report_id)
             if existing_report:
                 await self.report_repository.update_partial(
                     report_id,
@@ -74,27 +194,54 @@ class Orchestrator:
 
         return processed_results
 
-    def get_agents(self) -> Dict[str, Callable]:
-        return self._agents.copy()
+    async def execute_agents(self, report_id: str, token_id: str) -> Dict[str, Any]:
+        return await self.execute_agents_concurrently(report_id, token_id)
+
+    async def execute_batch(self, pairs: Iterable[Tuple[str, str]], max_concurrency: int = 16) -> List[Dict[str, Any] | BaseException]:
+        """
+        Runs `execute_agents_concurrently` for each (report_id, token_id) pair,
+        with at most `max_concurrency` reports in flight. Results are returned in
+        input order; a report that raises yields its exception instead.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(report_id: str, token_id: str) -> Dict[str, Any]:
+            # Runs in its own task under gather, so the context stays per report.
+            set_report_context(report_id, token_id)
+            async with semaphore:
+                return await self.execute_agents_concurrently(report_id, token_id)
+
+        return await asyncio.gather(*(run_one(report_id, token_id) for report_id, token_id in pairs), return_exceptions=True)
+
+    def get_agents(self) -> Mapping[str, Callable]:
+        """Returns a read-only live view of the registered agents."""
+        return MappingProxyType(self._agents)
 
     def aggregate_results(self, agent_results: Dict[str, Any]) -> Dict[str, Any]:
         combined_data = {}
+        merge = combined_data.update
         for agent_name, result in agent_results.items():
             if isinstance(result, dict) and result.get("status") == "completed":
-                combined_data.update(result.get("data", {}))
+                if data := result.get("data"):
+                    merge(data)
             else:
-                orchestrator_logger.error(f"Agent {agent_name} failed or returned unexpected result: {result}")
+                orchestrator_logger.error("Agent %s failed or returned unexpected result: %s", agent_name, result)
         return combined_data
 
 
+@lru_cache(maxsize=64)
+def _is_http_url(url: str) -> bool:
+    # The URLs come from settings, so repeated factory calls hit the cache.
+    parsed_url = urlparse(url)
+    return parsed_url.scheme in ("http", "https") and bool(parsed_url.netloc)
+
 def _is_valid_url(url: str | None, url_name: str) -> bool:
     if not url:
-        orchestrator_logger.warning(f"Configuration Error: {url_name} is missing. Skipping agent registration.")
+        orchestrator_logger.warning("Configuration Error: %s is missing. Skipping agent registration.", url_name)
         return False
-    parsed_url = urlparse(url)
-    if not parsed_url.scheme or not parsed_url.netloc or parsed_url.scheme not in ("http", "https"):
+    if not _is_http_url(url):
         orchestrator_logger.warning(
-            f"Configuration Error: {url_name} ('{url}') is not a valid HTTP/HTTPS URL. Skipping agent registration."
+            "Configuration Error: %s ('%s') is not a valid HTTP/HTTPS URL. Skipping agent registration.", url_name, url
         )
         return False
     return True
@@ -105,6 +252,12 @@ async def create_orchestrator(session_factory: Callable[..., AsyncSession] = Asy
     """
     orch = Orchestrator(session_factory)
 
+    # Resolved once here rather than on every agent call.
+    step_timeout = settings.AGENT_TIMEOUT - 1
+    cache_ttl = settings.AGENT_CACHE_TTL
+    team_profile_urls_by_token = settings.TEAM_PROFILE_URLS
+    whitepaper_sources_by_token = settings.WHITEPAPER_TEXT_SOURCES
+
     if register_dummy:
         orch.register_agent("dummy_agent", dummy_agent)
 
@@ -113,38 +266,37 @@ async def create_orchestrator(session_factory: Callable[..., AsyncSession] = Asy
     tokenomics_url = settings.TOKENOMICS_URL
 
     if _is_valid_url(onchain_metrics_url, "ONCHAIN_METRICS_URL") and _is_valid_url(tokenomics_url, "TOKENOMICS_URL"):
-        async def onchain_data_agent(report_id: str, token_id: str) -> Dict[str, Any]:
-            orchestrator_logger.info(f"Calling Onchain Data Agent for report_id: {report_id}, token_id: {token_id}")
-            onchain_metrics_params = {"token_id": token_id, "report_id": report_id}
-            tokenomics_params = {"token_id": token_id}
-
-            onchain_metrics_task = asyncio.create_task(fetch_onchain_metrics(url=onchain_metrics_url, params=onchain_metrics_params, token_id=token_id))
-            tokenomics_task = asyncio.create_task(fetch_tokenomics(url=tokenomics_url, params=tokenomics_params, token_id=token_id))
-            
+        # The validated URLs and fetchers are bound as defaults so each call reads
+        # them as locals rather than through closure cells.
+        async def onchain_data_agent(
+            report_id: str,
+            token_id: str,
+            _metrics_url: str = onchain_metrics_url,
+            _tokenomics_url: str = tokenomics_url,
+            _fetch_metrics: Callable = fetch_onchain_metrics,
+            _fetch_tokenomics: Callable = fetch_tokenomics,
+        ) -> Dict[str, Any]:
+            orchestrator_logger.info("Calling Onchain Data Agent for report_id: %s, token_id: %s", report_id, token_id)
             onchain_metrics_result = {}
             tokenomics_result = {}
 
             try:
                 onchain_metrics_result, tokenomics_result = await asyncio.gather(
-                    asyncio.wait_for(onchain_metrics_task, timeout=settings.AGENT_TIMEOUT - 1),
-                    asyncio.wait_for(tokenomics_task, timeout=settings.AGENT_TIMEOUT - 1),
-                    return_exceptions=True
+                    _guarded_fetch(
+                        _fetch_metrics(url=_metrics_url, params={"token_id": token_id, "report_id": report_id}, token_id=token_id),
+                        step_timeout, "Onchain metrics", report_id,
+                    ),
+                    _guarded_fetch(
+                        # Tokenomics do not depend on the report, so reports for the same token share one fetch.
+                        inflight_requests.run(
+                            ("tokenomics", _tokenomics_url, token_id),
+                            lambda: _fetch_tokenomics(url=_tokenomics_url, params={"token_id": token_id}, token_id=token_id),
+                            ttl=cache_ttl,
+                        ),
+                        step_timeout, "Tokenomics", report_id,
+                    ),
                 )
 
-                if isinstance(onchain_metrics_result, asyncio.TimeoutError):
-                    orchestrator_logger.error("Onchain metrics fetch timed out for report %s", report_id)
-                    onchain_metrics_result = {"status": "failed", "error": "Onchain metrics fetch timed out"}
-                elif isinstance(onchain_metrics_result, Exception):
-                    orchestrator_logger.error("Onchain metrics fetch failed for report %s", report_id)
-                    onchain_metrics_result = {"status": "failed", "error": str(onchain_metrics_result)}
-
-                if isinstance(tokenomics_result, asyncio.TimeoutError):
-                    orchestrator_logger.error("Tokenomics fetch timed out for report %s", report_id)
-                    tokenomics_result = {"status": "failed", "error": "Tokenomics fetch timed out"}
-                elif isinstance(tokenomics_result, Exception):
-                    orchestrator_logger.error("Tokenomics fetch failed for report %s", report_id)
-                    tokenomics_result = {"status": "failed", "error": str(tokenomics_result)}
-
                 overall_agent_status = "completed"
                 if onchain_metrics_result.get("status") == "failed" or tokenomics_result.get("status") == "failed":
                     overall_agent_status = "failed"
@@ -160,24 +312,31 @@ async def create_orchestrator(session_factory: Callable[..., AsyncSession] = Asy
                 existing_partial_agent_output = existing_report.partial_agent_output if existing_report else {}
                 await orch.report_repository.update_partial(report_id, {"partial_agent_output": {**existing_partial_agent_output, "onchain_data_agent": result}})
                 return result
-            except asyncio.TimeoutError:
-                orchestrator_logger.error("Onchain Data Agent timed out for report %s", report_id)
-                return {"status": "failed", "error": "Agent timed out"}
+            except TRANSIENT_AGENT_ERRORS:
+                # Retried by the orchestrator; reported as failed once retries run out.
+                orchestrator_logger.warning("Onchain Data Agent hit a transient error for report %s", report_id, exc_info=True)
+                raise
             except Exception as e:
                 orchestrator_logger.exception("Onchain Data Agent failed for report %s", report_id)
                 return {"status": "failed", "error": str(e)}
-        orch.register_agent('onchain_data_agent', onchain_data_agent)
+        orch.register_agent('onchain_data_agent', onchain_data_agent, max_retries=settings.AGENT_MAX_RETRIES)
     else:
         orchestrator_logger.warning("Onchain Data Agent will not be registered due to invalid configuration.")
 
+    # The social and team/doc agents hold no per-report state, so one instance of
+    # each serves every report handled by this orchestrator.
+    social_agent = SocialSentimentAgent()
+    team_doc_agent = TeamDocAgent()
+
     # Configure and register Social Sentiment Agent
     async def social_sentiment_agent_func(report_id: str, token_id: str) -> Dict[str, Any]:
-        orchestrator_logger.info(f"Calling Social Sentiment Agent for report_id: {report_id}, token_id: {token_id}")
-        agent = SocialSentimentAgent()
+        orchestrator_logger.info("Calling Social Sentiment Agent for report_id: %s, token_id: %s", report_id, token_id)
+        agent = social_agent
         try:
-            social_data = await asyncio.wait_for(agent.fetch_social_data(token_id), timeout=settings.AGENT_TIMEOUT - 1)
-            sentiment_report = await asyncio.wait_for(agent.analyze_sentiment(social_data), timeout=settings.AGENT_TIMEOUT - 1)
-            orchestrator_logger.info(f"Social Sentiment Agent completed for report {report_id}.")
+            async with asyncio.timeout(step_timeout):
+                social_data = await inflight_requests.run(("social_data", token_id), lambda: agent.fetch_social_data(token_id), ttl=cache_ttl, cache_if=_has_all_social_sources)
+                sentiment_report = await agent.analyze_sentiment(social_data)
+            orchestrator_logger.info("Social Sentiment Agent completed for report %s.", report_id)
             result = {
                 "status": "completed",
                 "data": {
@@ -192,41 +351,42 @@ async def create_orchestrator(session_factory: Callable[..., AsyncSession] = Asy
             existing_partial_agent_output = existing_report.partial_agent_output if existing_report else {}
             await orch.report_repository.update_partial(report_id, {"partial_agent_output": {**existing_partial_agent_output, "social_sentiment_agent": result}})
             return result
-        except asyncio.TimeoutError:
-            orchestrator_logger.error("Social Sentiment Agent timed out for report %s", report_id)
-            return {"status": "failed", "error": "Agent timed out"}
+        except TRANSIENT_AGENT_ERRORS:
+            # Retried by the orchestrator; reported as failed once retries run out.
+            orchestrator_logger.warning("Social Sentiment Agent hit a transient error for report %s", report_id, exc_info=True)
+            raise
         except Exception as e:
             orchestrator_logger.exception("Social Sentiment Agent failed for report %s", report_id)
             return {"status": "failed", "error": str(e)}
-    orch.register_agent('social_sentiment_agent', social_sentiment_agent_func)
+    orch.register_agent('social_sentiment_agent', social_sentiment_agent_func, max_retries=settings.AGENT_MAX_RETRIES)
 
     # Configure and register Team and Documentation Agent
     async def team_documentation_agent(report_id: str, token_id: str) -> Dict[str, Any]:
-        orchestrator_logger.info(f"Calling Team and Documentation Agent for report_id: {report_id}, token_id: {token_id}")
-        agent = TeamDocAgent()
+        orchestrator_logger.info("Calling Team and Documentation Agent for report_id: %s, token_id: %s", report_id, token_id)
+        agent = team_doc_agent
         team_analysis = []
         whitepaper_summary = {}
 
-        team_profile_urls = settings.TEAM_PROFILE_URLS.get(token_id, [])
-        whitepaper_text_source = settings.WHITEPAPER_TEXT_SOURCES.get(token_id, "")
+        team_profile_urls = team_profile_urls_by_token.get(token_id, [])
+        whitepaper_text_source = whitepaper_sources_by_token.get(token_id, "")
 
         try:
-            orchestrator_logger.info(f"Scraping team profiles for token {token_id} from URLs: {team_profile_urls}")
-            team_analysis = await asyncio.wait_for(
-                asyncio.to_thread(agent.scrape_team_profiles, team_profile_urls),
-                timeout=settings.AGENT_TIMEOUT - 1
-            )
-            orchestrator_logger.info(f"Team profile scraping completed for token {token_id}.")
+            loop = asyncio.get_running_loop()
+            orchestrator_logger.info("Scraping team profiles for token %s from URLs: %s", token_id, team_profile_urls)
+            scrape = loop.run_in_executor(_team_doc_executor, agent.scrape_team_profiles, team_profile_urls)
 
             if whitepaper_text_source:
-                orchestrator_logger.info(f"Analyzing whitepaper for token {token_id} from source: {whitepaper_text_source}")
-                whitepaper_summary = await asyncio.wait_for(
-                    asyncio.to_thread(agent.analyze_whitepaper, whitepaper_text_source),
-                    timeout=settings.AGENT_TIMEOUT - 1
-                )
-                orchestrator_logger.info(f"Whitepaper analysis completed for token {token_id}.")
+                orchestrator_logger.info("Analyzing whitepaper for token %s from source: %s", token_id, whitepaper_text_source)
+                async with asyncio.timeout(step_timeout):
+                    team_analysis, whitepaper_summary = await asyncio.gather(
+                        scrape, loop.run_in_executor(_team_doc_executor, agent.analyze_whitepaper, whitepaper_text_source)
+                    )
+                orchestrator_logger.info("Team profile scraping and whitepaper analysis completed for token %s.", token_id)
             else:
-                orchestrator_logger.warning(f"No whitepaper text source provided for token {token_id}. Skipping whitepaper analysis.")
+                orchestrator_logger.warning("No whitepaper text source provided for token %s. Skipping whitepaper analysis.", token_id)
+                async with asyncio.timeout(step_timeout):
+                    team_analysis = await scrape
+                orchestrator_logger.info("Team profile scraping completed for token %s.", token_id)
 
             result = {
                 "status": "completed",
@@ -237,47 +397,38 @@ async def create_orchestrator(session_factory: Callable[..., AsyncSession] = Asy
                     }
                 }
             }
-            existing_report = orch.report_repository.get_report_by_id(report_id)
+            existing_report = await orch.report_repository.get_report_by_id(report_id)
             existing_partial_agent_output = existing_report.partial_agent_output if existing_report else {}
             await orch.report_repository.update_partial(report_id, {"partial_agent_output": {**existing_partial_agent_output, "team_documentation_agent": result}})
             return result
-        except asyncio.TimeoutError:
-            orchestrator_logger.error("Team and Documentation Agent timed out for report %s", report_id)
-            return {"status": "failed", "error": "Agent timed out"}
+        except TRANSIENT_AGENT_ERRORS:
+            # Retried by the orchestrator; reported as failed once retries run out.
+            orchestrator_logger.warning("Team and Documentation Agent hit a transient error for report %s", report_id, exc_info=True)
+            raise
         except Exception as e:
             orchestrator_logger.exception("Team and Documentation Agent failed for report %s", report_id)
             return {"status": "failed", "error": str(e)}
-    orch.register_agent('team_documentation_agent', team_documentation_agent)
+    orch.register_agent('team_documentation_agent', team_documentation_agent, max_retries=settings.AGENT_MAX_RETRIES)
 
     # Configure and register Code/Audit Agent
     code_audit_repo_url = settings.CODE_AUDIT_REPO_URL
     if _is_valid_url(code_audit_repo_url, "CODE_AUDIT_REPO_URL"):
         async def code_audit_agent_func(report_id: str, token_id: str) -> Dict[str, Any]:
-            orchestrator_logger.info(f"Calling Code/Audit Agent for report_id: {report_id}, token_id: {token_id}")
+            orchestrator_logger.info("Calling Code/Audit Agent for report_id: %s, token_id: %s", report_id, token_id)
             code_metrics_data = {}
             audit_summary_data = []
             try:
-                async with CodeAuditAgent() as agent:
-                    orchestrator_logger.info(f"Fetching repository metrics for {code_audit_repo_url}")
-                    code_metrics = await asyncio.wait_for(
-                        agent.fetch_repo_metrics(code_audit_repo_url),
-                        timeout=settings.AGENT_TIMEOUT - 1
-                    )
+                async with CodeAuditAgent() as agent, asyncio.timeout(step_timeout):
+                    orchestrator_logger.info("Fetching repository metrics for %s", code_audit_repo_url)
+                    code_metrics = await inflight_requests.run(("repo_metrics", code_audit_repo_url), lambda: _fetch_repo_metrics(code_audit_repo_url), ttl=cache_ttl, cache_if=_has_repo_metrics)
                     code_metrics_data = code_metrics.model_dump()
 
-                    orchestrator_logger.info(f"Analyzing code activity for {code_audit_repo_url}")
-                    code_activity_analysis = await asyncio.wait_for(
-                        agent.analyze_code_activity(code_metrics),
-                        timeout=settings.AGENT_TIMEOUT - 1
-                    )
+                    orchestrator_logger.info("Analyzing code activity for %s", code_audit_repo_url)
+                    code_activity_analysis = await agent.analyze_code_activity(code_metrics)
                     code_metrics_data.update({"activity_analysis": code_activity_analysis})
 
-                    orchestrator_logger.info(f"Searching and summarizing audit reports for {code_audit_repo_url}")
-                    audit_summary = await asyncio.wait_for(
-                        agent.search_and_summarize_audit_reports(code_audit_repo_url),
-                        timeout=settings.AGENT_TIMEOUT - 1
-                    )
-                    audit_summary_data = audit_summary
+                    orchestrator_logger.info("Searching and summarizing audit reports for %s", code_audit_repo_url)
+                    audit_summary_data = await inflight_requests.run(("audit_reports", code_audit_repo_url), lambda: _search_audit_reports(code_audit_repo_url), ttl=cache_ttl, cache_if=bool)
 
                 result = {
                     "status": "completed",
@@ -292,13 +443,14 @@ async def create_orchestrator(session_factory: Callable[..., AsyncSession] = Asy
                 existing_partial_agent_output = existing_report.partial_agent_output if existing_report else {}
                 await orch.report_repository.update_partial(report_id, {"partial_agent_output": {**existing_partial_agent_output, "code_audit_agent": result}})
                 return result
-            except asyncio.TimeoutError:
-                orchestrator_logger.error("Code/Audit Agent timed out for report %s", report_id)
-                return {"status": "failed", "error": "Agent timed out"}
+            except TRANSIENT_AGENT_ERRORS:
+                # Retried by the orchestrator; reported as failed once retries run out.
+                orchestrator_logger.warning("Code/Audit Agent hit a transient error for report %s", report_id, exc_info=True)
+                raise
             except Exception as e:
                 orchestrator_logger.exception("Code/Audit Agent failed for report %s", report_id)
                 return {"status": "failed", "error": str(e)}
-        orch.register_agent('code_audit_agent', code_audit_agent_func)
+        orch.register_agent('code_audit_agent', code_audit_agent_func, max_retries=settings.AGENT_MAX_RETRIES)
     else:
         orchestrator_logger.warning("Code/Audit Agent will not be registered due to invalid CODE_AUDIT_REPO_URL configuration.")
 
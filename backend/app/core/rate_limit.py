@@ -0,0 +1,36 @@
+import asyncio
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+
+from backend.app.core.config import settings
+
+
+class HostLimiter:
+    """
+    Throttles outbound requests per upstream host without blocking other hosts.
+
+    Each host gets a semaphore bounding its in-flight requests and a schedule
+    that spaces request starts at least `min_interval` seconds apart. Callers
+    waiting on one host never delay calls to another.
+    """
+    def __init__(self, max_concurrency: int, min_interval: float):
+        self.max_concurrency = max_concurrency
+        self.min_interval = min_interval
+        self._semaphores: Dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(self.max_concurrency))
+        self._next_start: Dict[str, float] = defaultdict(float)
+
+    @asynccontextmanager
+    async def acquire(self, host: str) -> AsyncIterator[None]:
+        async with self._semaphores[host]:
+            now = time.monotonic()
+            start = max(now, self._next_start[host])
+            # Reserve the slot before sleeping so concurrent callers queue behind it.
+            self._next_start[host] = start + self.min_interval
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
+
+host_limiter = HostLimiter(settings.MAX_CONCURRENT_REQUESTS_PER_HOST, settings.REQUEST_DELAY_SECONDS)
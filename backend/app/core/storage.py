@@ -1,42 +1,39 @@
-
 import threading
 
 REPORT_STORE = {}
-_report_store_lock = threading.Lock()
+# Only the check-and-set in try_set_processing needs a lock; single-key dict reads
+# and writes are atomic under the GIL. Locks are sharded by report id so claims on
+# unrelated reports never wait on each other.
+_LOCK_SHARDS = 32
+_report_locks = tuple(threading.Lock() for _ in range(_LOCK_SHARDS))
+
+def _lock_for(report_id: str) -> threading.Lock:
+    return _report_locks[hash(report_id) & (_LOCK_SHARDS - 1)]
 
 def set_report_status(report_id: str, status: str):
     """Sets the status of a report."""
-    with _report_store_lock:
-        if report_id not in REPORT_STORE:
-            REPORT_STORE[report_id] = {"status": status, "data": None}
-        else:
-            REPORT_STORE[report_id]["status"] = status
+    REPORT_STORE.setdefault(report_id, {"status": status, "data": None})["status"] = status
 
 def get_report_status(report_id: str) -> str | None:
     """Gets the status of a report."""
-    with _report_store_lock:
-        return REPORT_STORE.get(report_id, {}).get("status")
+    entry = REPORT_STORE.get(report_id)
+    return entry["status"] if entry is not None else None
 
 def try_set_processing(report_id: str) -> bool:
     """
     Atomically checks if a report is not processing and, if so, sets its status to "processing".
     Returns True if successful, False otherwise.
     """
-    with _report_store_lock:
-        if REPORT_STORE.get(report_id, {}).get("status") != "processing":
-            if report_id not in REPORT_STORE:
-                REPORT_STORE[report_id] = {"status": "processing", "data": None}
-            else:
-                REPORT_STORE[report_id]["status"] = "processing"
-            return True
-        return False
+    with _lock_for(report_id):
+        entry = REPORT_STORE.setdefault(report_id, {"status": None, "data": None})
+        if entry["status"] == "processing":
+            return False
+        entry["status"] = "processing"
+        return True
 
 def save_report_data(report_id: str, data: dict, key: str = "data", update_status: bool = False):
     """Saves the data for a report under a specific key."""
-    with _report_store_lock:
-        if report_id not in REPORT_STORE:
-            REPORT_STORE[report_id] = {"status": "processing", "data": None, key: data}
-        else:
-            REPORT_STORE[report_id][key] = data
-        if update_status:
-            REPORT_STORE[report_id]["status"] = "completed"
+    entry = REPORT_STORE.setdefault(report_id, {"status": "processing", "data": None})
+    entry[key] = data
+    if update_status:
+        entry["status"] = "completed"
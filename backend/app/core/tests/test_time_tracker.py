@@ -1,3 +1,5 @@
+import time
+
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime, timedelta
@@ -9,7 +11,7 @@ from backend.app.db.repositories.report_repository import ReportRepository # Imp
 @pytest.fixture
 def mock_redis_client():
     # Patch redis_client where it's used in time_tracker.py
-    with patch('backend.app.core.time_tracker.redis_client', new_callable=Mock) as mock:
+    with patch('backend.app.core.time_tracker.redis_client', new_callable=AsyncMock) as mock:
         yield mock
 
 @pytest.fixture
@@ -28,9 +30,10 @@ def mock_async_session():
     return AsyncMock(spec=AsyncSession)
 
 
-def test_start_timer(mock_redis_client):
+@pytest.mark.asyncio
+async def test_start_timer(mock_redis_client):
     report_id = "test_report_1"
-    start_timer(report_id)
+    await start_timer(report_id)
     mock_redis_client.set_cache.assert_called_once()
     args, kwargs = mock_redis_client.set_cache.call_args
     assert args[0] == f"report_timer:{report_id}"
@@ -41,12 +44,11 @@ async def test_finish_timer_under_five_minutes(mock_redis_client, mock_report_re
     report_id = "test_report_2"
     
     # Simulate start_timer
-    mock_redis_client.get_cache.return_value = datetime.now().isoformat().encode('utf-8')
+    mock_redis_client.pop_cache.return_value = str(time.time_ns()).encode()
     
     duration = await finish_timer(report_id, mock_async_session)
     
-    mock_redis_client.get_cache.assert_called_once_with(f"report_timer:{report_id}")
-    mock_redis_client.delete_cache.assert_called_once_with(f"report_timer:{report_id}")
+    mock_redis_client.pop_cache.assert_called_once_with(f"report_timer:{report_id}")
     assert isinstance(duration, float)
     mock_report_repository_instance.get_report_by_id.assert_not_called()
     mock_report_repository_instance.update_timing_alerts.assert_not_called()
@@ -56,8 +58,8 @@ async def test_finish_timer_over_five_minutes(mock_redis_client, mock_report_rep
     report_id = "test_report_3"
     
     # Simulate start_timer more than 5 minutes ago
-    five_minutes_ago = datetime.now() - timedelta(minutes=5, seconds=1)
-    mock_redis_client.get_cache.return_value = five_minutes_ago.isoformat().encode('utf-8')
+    five_minutes_ago = time.time_ns() - int(timedelta(minutes=5, seconds=1).total_seconds() * 1e9)
+    mock_redis_client.pop_cache.return_value = str(five_minutes_ago).encode()
     
     mock_report_state = ReportState(report_id=report_id)
     mock_report_repository_instance.get_report_by_id.return_value = mock_report_state
@@ -65,8 +67,7 @@ async def test_finish_timer_over_five_minutes(mock_redis_client, mock_report_rep
     
     duration = await finish_timer(report_id, mock_async_session)
     
-    mock_redis_client.get_cache.assert_called_once_with(f"report_timer:{report_id}")
-    mock_redis_client.delete_cache.assert_called_once_with(f"report_timer:{report_id}")
+    mock_redis_client.pop_cache.assert_called_once_with(f"report_timer:{report_id}")
     assert isinstance(duration, float)
     assert duration > 300
     
@@ -85,12 +86,11 @@ async def test_finish_timer_over_five_minutes(mock_redis_client, mock_report_rep
 @pytest.mark.asyncio
 async def test_finish_timer_not_found(mock_redis_client, mock_report_repository_class, mock_report_repository_instance, mock_async_session):
     report_id = "test_report_4"
-    mock_redis_client.get_cache.return_value = None
+    mock_redis_client.pop_cache.return_value = None
     
     duration = await finish_timer(report_id, mock_async_session)
     
-    mock_redis_client.get_cache.assert_called_once_with(f"report_timer:{report_id}")
-    mock_redis_client.delete_cache.assert_not_called()
+    mock_redis_client.pop_cache.assert_called_once_with(f"report_timer:{report_id}")
     assert duration is None
     mock_report_repository_instance.get_report_by_id.assert_not_called()
     mock_report_repository_instance.update_timing_alerts.assert_not_called()
@@ -98,7 +98,7 @@ async def test_finish_timer_not_found(mock_redis_client, mock_report_repository_
 @pytest.mark.asyncio
 async def test_finish_timer_exception(mock_redis_client, mock_report_repository_class, mock_report_repository_instance, mock_async_session):
     report_id = "test_report_5"
-    mock_redis_client.get_cache.side_effect = Exception("Redis error")
+    mock_redis_client.pop_cache.side_effect = Exception("Redis error")
     
     duration = await finish_timer(report_id, mock_async_session)
     
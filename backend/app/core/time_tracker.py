@@ -1,4 +1,5 @@
 import logging
+import time
 from datetime import datetime, timezone
 import json
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,43 +11,42 @@ logger = logging.getLogger(__name__)
 
 REDIS_KEY_PREFIX = "report_timer:"
 
-def start_timer(report_id: str):
+async def start_timer(report_id: str):
     """
     Records the start timestamp for a given report_id in Redis.
     """
     try:
-        start_time = datetime.now(timezone.utc).isoformat()
+        # Stored as integer epoch nanoseconds: cheap to write and to subtract, and
+        # unlike a monotonic clock it is comparable across the API and worker processes.
+        start_time_ns = time.time_ns()
         key = f"{REDIS_KEY_PREFIX}{report_id}"
-        redis_client.set_cache(key, start_time, ttl=3600 * 24)  # Store for 24 hours
-        logger.info(f"Timer started for report_id: {report_id} at {start_time}")
+        await redis_client.set_cache(key, str(start_time_ns), ttl=3600 * 24)  # Store for 24 hours
+        logger.info("Timer started for report_id: %s at %s", report_id, start_time_ns)
     except Exception as e:
-        logger.error(f"Failed to start timer for report_id {report_id}: {e}", exc_info=True)
+        logger.error("Failed to start timer for report_id %s: %s", report_id, e, exc_info=True)
 
 async def finish_timer(report_id: str, db: AsyncSession) -> float | None:
     """
-    Retrieves the start timestamp, calculates the duration, and removes the timer from Redis.
+    Retrieves and removes the start timestamp from Redis in one round trip, then calculates the duration.
     Returns the duration in seconds or None if the timer was not found or an error occurred.
     Also, logs a warning and stores it in report state if processing exceeds five minutes.
     """
     key = f"{REDIS_KEY_PREFIX}{report_id}"
-    report_repo = ReportRepository(lambda: db) # type: ignore
+    report_repo = ReportRepository(db)
     try:
-        start_time_str = redis_client.get_cache(key)
-        if start_time_str:
-            redis_client.delete_cache(key)
-            start_time = datetime.fromisoformat(start_time_str.decode('utf-8')).replace(tzinfo=timezone.utc)
-            end_time = datetime.now(timezone.utc)
-            duration = (end_time - start_time).total_seconds()
-            logger.info(f"Timer finished for report_id: {report_id}. Duration: {duration:.2f} seconds.")
+        start_time_ns = await redis_client.pop_cache(key)
+        if start_time_ns:
+            duration = (time.time_ns() - int(start_time_ns)) / 1e9
+            logger.info("Timer finished for report_id: %s. Duration: %.2f seconds.", report_id, duration)
 
             if duration > 300:  # 5 minutes
                 warning_message = {
-                    "timestamp": end_time.isoformat(),
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
                     "message": f"Report processing time exceeded 5 minutes. Duration: {duration:.2f} seconds.",
                     "threshold": "5 minutes"
                 }
                 logger.warning(
-                    f"Report {report_id} processing time exceeded 5 minutes. Duration: {duration:.2f} seconds."
+                    "Report %s processing time exceeded 5 minutes. Duration: %.2f seconds.", report_id, duration
                 )
 
                 report_state: ReportState | None = await report_repo.get_report_by_id(report_id)
@@ -55,12 +55,12 @@ async def finish_timer(report_id: str, db: AsyncSession) -> float | None:
                     timing_alerts.append(warning_message)
                     await report_repo.update_timing_alerts(report_id, timing_alerts)
                 else:
-                    logger.error(f"ReportState not found for report_id {report_id}. Cannot store timing alert.")
+                    logger.error("ReportState not found for report_id %s. Cannot store timing alert.", report_id)
 
             return duration
         else:
-            logger.warning(f"Timer not found for report_id: {report_id}")
+            logger.warning("Timer not found for report_id: %s", report_id)
             return None
     except Exception as e:
-        logger.error(f"Failed to finish timer for report_id {report_id}: {e}", exc_info=True)
+        logger.error("Failed to finish timer for report_id %s: %s", report_id, e, exc_info=True)
         return None
@@ -1,7 +1,12 @@
 from typing import AsyncGenerator
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 
-SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+from backend.app.core.config import settings
+from backend.app.db.repositories.report_repository import ReportRepository
+
+# Plain sqlite URLs (as in .env) are upgraded to the aiosqlite driver, mirroring the migrations env.
+SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
 
 if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
     # SQLite async support via aiosqlite driver
@@ -24,3 +29,8 @@ AsyncSessionLocal = async_sessionmaker(
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         yield session
+
+
+def get_report_repository(session: AsyncSession = Depends(get_db)) -> ReportRepository:
+    """FastAPI dependency providing a ReportRepository bound to the request's session."""
+    return ReportRepository(session)
@@ -1,14 +1,30 @@
-from typing import Callable, Dict, Any, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Any, Optional
 from datetime import datetime, timedelta, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
 from backend.app.db.models.report import Report
 from backend.app.db.models.report_state import ReportState, ReportStatusEnum
+
 class ReportRepository:
     FINAL_STATUSES = [ReportStatusEnum.COMPLETED, ReportStatusEnum.FAILED, ReportStatusEnum.TIMED_OUT]
-    def __init__(self, session_factory: Callable[..., AsyncSession]):
-        self.session_factory = session_factory
+    def __init__(self, session_or_factory: AsyncSession | Callable[..., AsyncSession]):
+        """
+        Accepts either a session factory, which opens a new session per operation,
+        or a request-scoped AsyncSession, which every operation reuses and which
+        stays owned (and closed) by its provider.
+        """
+        if isinstance(session_or_factory, AsyncSession):
+            session = session_or_factory
+
+            @asynccontextmanager
+            async def _borrow_session() -> AsyncIterator[AsyncSession]:
+                yield session
+
+            self.session_factory = _borrow_session
+        else:
+            self.session_factory = session_or_factory
 
     async def save_report_initial_state(self, report_id: str) -> ReportState:
         """
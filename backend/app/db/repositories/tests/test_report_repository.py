@@ -110,3 +110,17 @@ async def test_recover_stalled_reports(report_repository, async_session_factory)
             select(ReportState).where(ReportState.report_id == "report_completed")
         )
         assert completed_report_state.scalar_one().status == ReportStatusEnum.COMPLETED
+
+@pytest.mark.asyncio
+async def test_repository_reuses_request_scoped_session(async_session_factory):
+    async with async_session_factory() as session:
+        repository = ReportRepository(session)
+
+        await repository.create_report_entry("report_shared_session")
+        await repository.update_report_status("report_shared_session", ReportStatusEnum.RUNNING)
+        report_state = await repository.get_report_by_id("report_shared_session")
+
+        assert report_state.status == ReportStatusEnum.RUNNING
+        # The borrowed session stays open and usable by its owner
+        result = await session.execute(select(Report).where(Report.id == "report_shared_session"))
+        assert result.scalar_one_or_none() is not None
@@ -21,4 +21,12 @@ async def get_current_user():
         )
     return user
 
+async def resolve_current_user() -> User:
+    """
+    Resolves the current user as a plain coroutine, for handlers that overlap
+    authentication with their own I/O instead of resolving it as a dependency.
+    Like get_current_user, it does not yet read credentials from the request.
+    """
+    return await get_current_user()
+
 CurrentUser = Annotated[User, Depends(get_current_user)]
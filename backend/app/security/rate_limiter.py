@@ -2,7 +2,8 @@ import time
 import logging
 import threading
 from collections import defaultdict
-from backend.app.cache.redis_client import redis_client
+import redis
+from redis.exceptions import RedisError
 from backend.app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -20,12 +21,31 @@ class RateLimiter:
         return cls._instance
 
     def _initialize(self):
-        self.redis = redis_client.client
+        self.redis = self._initialize_redis_client()
         self.limits = settings.RATE_LIMITS # This will be defined in config.py
         self.in_memory_counters = defaultdict(lambda: {'count': 0, 'last_reset': time.time()})
         if not self.redis:
             logger.warning("Redis client not available, using in-memory rate limiting. This is not recommended for production.")
 
+    @staticmethod
+    def _initialize_redis_client():
+        # check_rate_limit is synchronous and is also called from worker threads
+        # (e.g. team profile scraping), so the limiter keeps its own blocking client.
+        try:
+            client = redis.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                password=settings.REDIS_PASSWORD,
+                decode_responses=True
+            )
+            client.ping()
+        except RedisError:
+            logger.warning("Redis unavailable for rate limiting", exc_info=True)
+            return None
+        else:
+            return client
+
     def check_rate_limit(self, service: str, count: int = 1) -> bool:
         """
         Checks if a request for a given service is within the allowed rate limit.
@@ -1,27 +1,30 @@
 import os
 import re
 import json
+import orjson
 import hashlib
 from typing import Dict, Any, List
 import httpx
 from pydantic import BaseModel, Field
 import urllib.parse
+from backend.app.core.http_client import get_http_client
+from backend.app.core.rate_limit import host_limiter
 from backend.app.security.rate_limiter import rate_limiter
 from backend.app.utils.cache_utils import cache_request
 
 from backend.app.core.logger import services_logger as logger
 
-def serialize_httpx_response(response: httpx.Response) -> str:
-    """Serializes an httpx.Response object to a JSON string."""
-    return json.dumps({
+def serialize_httpx_response(response: httpx.Response) -> bytes:
+    """Serializes an httpx.Response object to JSON bytes."""
+    return orjson.dumps({
         "status_code": response.status_code,
         "headers": dict(response.headers),
         "text": response.text,
     })
 
-def deserialize_httpx_response(data_str: str) -> httpx.Response:
-    """Deserializes a JSON string back into a mock httpx.Response object."""
-    data = json.loads(data_str)
+def deserialize_httpx_response(data_str: bytes | str) -> httpx.Response:
+    """Deserializes a JSON payload back into a mock httpx.Response object."""
+    data = orjson.loads(data_str)
 
     class MockResponse:
         def __init__(self, status_code, headers, text):
@@ -79,8 +82,9 @@ class CodeAuditResult(BaseModel):
 class CodeAuditAgent:
     """
     Agent for auditing codebases, fetching repository metrics, and summarizing audit reports.
-    This class is designed to be used as an async context manager to ensure proper
-    management of the underlying httpx.AsyncClient.
+    This class is designed to be used as an async context manager. It owns no
+    resources: requests go through the process-wide shared httpx.AsyncClient,
+    and leaving the context only drops the agent's reference to it.
 
     Example usage:
         async with CodeAuditAgent() as agent:
@@ -93,9 +97,14 @@ class CodeAuditAgent:
         self.client = None
 
     async def __aenter__(self):
-        self.client = httpx.AsyncClient()
+        self.client = get_http_client()
         return self
 
+    async def _get(self, url: str, headers: Dict[str, str]) -> httpx.Response:
+        # GitHub/GitLab calls share the per-host limiter with the other agents' upstream calls.
+        async with host_limiter.acquire(urllib.parse.urlsplit(url).netloc):
+            return await self.client.get(url, headers=headers)
+
     async def _fetch_github_repo_data(self, owner: str, repo: str) -> Dict[str, Any]:
         logger.info(f"CodeAuditAgent: Fetching GitHub repo data for {owner}/{repo}.")
         headers = {"Authorization": f"token {self.github_token}"} if self.github_token else {}
@@ -140,7 +149,7 @@ class CodeAuditAgent:
                 return repo_data
             commits_resp = await cache_request(
                 url=f"{base_url}/commits?per_page=1",
-                external_api_call=lambda: self.client.get(f"{base_url}/commits?per_page=1", headers=headers),
+                external_api_call=lambda: self._get(f"{base_url}/commits?per_page=1", headers=headers),
                 serializer=serialize_httpx_response,
                 deserializer=deserialize_httpx_response,
                 params={"token_hash": hashlib.sha256(self.github_token.encode()).hexdigest()[:8]} if self.github_token else {}
@@ -157,7 +166,7 @@ class CodeAuditAgent:
                 return repo_data
             contributors_resp = await cache_request(
                 url=f"{base_url}/contributors?per_page=1",
-                external_api_call=lambda: self.client.get(f"{base_url}/contributors?per_page=1", headers=headers),
+                external_api_call=lambda: self._get(f"{base_url}/contributors?per_page=1", headers=headers),
                 serializer=serialize_httpx_response,
                 deserializer=deserialize_httpx_response,
                 params={"token_hash": hashlib.sha256(self.github_token.encode()).hexdigest()[:8]} if self.github_token else {}
@@ -174,7 +183,7 @@ class CodeAuditAgent:
                 return repo_data
             releases_resp = await cache_request(
                 url=f"{base_url}/releases/latest",
-                external_api_call=lambda: self.client.get(f"{base_url}/releases/latest", headers=headers),
+                external_api_call=lambda: self._get(f"{base_url}/releases/latest", headers=headers),
                 serializer=serialize_httpx_response,
                 deserializer=deserialize_httpx_response,
                 params={"token_hash": hashlib.sha256(self.github_token.encode()).hexdigest()[:8]} if self.github_token else {}
@@ -195,7 +204,7 @@ class CodeAuditAgent:
             search_issues_url = f"https://api.github.com/search/issues?q={search_query}&per_page=1"
             issues_search_resp = await cache_request(
                 url=search_issues_url,
-                external_api_call=lambda: self.client.get(search_issues_url, headers=headers),
+                external_api_call=lambda: self._get(search_issues_url, headers=headers),
                 serializer=serialize_httpx_response,
                 deserializer=deserialize_httpx_response,
                 params={"token_hash": hashlib.sha256(self.github_token.encode()).hexdigest()[:8]} if self.github_token else {}
@@ -212,7 +221,7 @@ class CodeAuditAgent:
                 return repo_data
             pulls_resp = await cache_request(
                 url=f"{base_url}/pulls?state=all&per_page=1",
-                external_api_call=lambda: self.client.get(f"{base_url}/pulls?state=all&per_page=1", headers=headers),
+                external_api_call=lambda: self._get(f"{base_url}/pulls?state=all&per_page=1", headers=headers),
                 serializer=serialize_httpx_response,
                 deserializer=deserialize_httpx_response,
                 params={"token_hash": hashlib.sha256(self.github_token.encode()).hexdigest()[:8]} if self.github_token else {}
@@ -255,7 +264,7 @@ class CodeAuditAgent:
                 return repo_data
             commits_resp = await cache_request(
                 url=f"{base_url}/repository/commits?per_page=1",
-                external_api_call=lambda: self.client.get(f"{base_url}/repository/commits?per_page=1", headers=headers),
+                external_api_call=lambda: self._get(f"{base_url}/repository/commits?per_page=1", headers=headers),
                 serializer=serialize_httpx_response,
                 deserializer=deserialize_httpx_response,
                 params={"token_hash": hashlib.sha256(self.gitlab_token.encode()).hexdigest()[:8]} if self.gitlab_token else {}
@@ -271,7 +280,7 @@ class CodeAuditAgent:
                 return repo_data
             contributors_resp = await cache_request(
                 url=f"{base_url}/repository/contributors?per_page=1",
-                external_api_call=lambda: self.client.get(f"{base_url}/repository/contributors?per_page=1", headers=headers),
+                external_api_call=lambda: self._get(f"{base_url}/repository/contributors?per_page=1", headers=headers),
                 serializer=serialize_httpx_response,
                 deserializer=deserialize_httpx_response,
                 params={"token_hash": hashlib.sha256(self.gitlab_token.encode()).hexdigest()[:8]} if self.gitlab_token else {}
@@ -287,7 +296,7 @@ class CodeAuditAgent:
                 return repo_data
             tags_resp = await cache_request(
                 url=f"{base_url}/repository/tags?per_page=1",
-                external_api_call=lambda: self.client.get(f"{base_url}/repository/tags?per_page=1", headers=headers),
+                external_api_call=lambda: self._get(f"{base_url}/repository/tags?per_page=1", headers=headers),
                 serializer=serialize_httpx_response,
                 deserializer=deserialize_httpx_response,
                 params={"token_hash": hashlib.sha256(self.gitlab_token.encode()).hexdigest()[:8]} if self.gitlab_token else {}
@@ -306,7 +315,7 @@ class CodeAuditAgent:
                 return repo_data
             issues_resp = await cache_request(
                 url=f"{base_url}/issues?scope=all&per_page=1",
-                external_api_call=lambda: self.client.get(f"{base_url}/issues?scope=all&per_page=1", headers=headers),
+                external_api_call=lambda: self._get(f"{base_url}/issues?scope=all&per_page=1", headers=headers),
                 serializer=serialize_httpx_response,
                 deserializer=deserialize_httpx_response,
                 params={"token_hash": hashlib.sha256(self.gitlab_token.encode()).hexdigest()[:8]} if self.gitlab_token else {}
@@ -322,7 +331,7 @@ class CodeAuditAgent:
                 return repo_data
             merge_requests_resp = await cache_request(
                 url=f"{base_url}/merge_requests?scope=all&per_page=1",
-                external_api_call=lambda: self.client.get(f"{base_url}/merge_requests?scope=all&per_page=1", headers=headers),
+                external_api_call=lambda: self._get(f"{base_url}/merge_requests?scope=all&per_page=1", headers=headers),
                 serializer=serialize_httpx_response,
                 deserializer=deserialize_httpx_response,
                 params={"token_hash": hashlib.sha256(self.gitlab_token.encode()).hexdigest()[:8]} if self.gitlab_token else {}
@@ -499,5 +508,5 @@ class CodeAuditAgent:
 
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        self.client = None
 
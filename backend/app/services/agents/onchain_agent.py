@@ -1,8 +1,11 @@
-import asyncio
 import httpx
+from functools import lru_cache
+from urllib.parse import urlparse
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from backend.app.core.config import settings
+from backend.app.core.http_client import get_http_client
+from backend.app.core.rate_limit import host_limiter
 from backend.app.core.logger import services_logger as logger
 from backend.app.security.rate_limiter import rate_limiter
 
@@ -17,15 +20,21 @@ def log_retry_attempt(retry_state):
         pass # token_id remains "unknown"
 
     logger.warning(
-        f"OnchainAgent: Retrying {retry_state.fn.__name__} for token_id: {token_id}, "
-        f"attempt {retry_state.attempt_number}, "
-        f"exception: {retry_state.outcome.exception()}, "
-        f"next backoff: {retry_state.next_action.sleep} seconds."
+        "OnchainAgent: Retrying %s for token_id: %s, attempt %s, exception: %s, next backoff: %s seconds.",
+        retry_state.fn.__name__,
+        token_id,
+        retry_state.attempt_number,
+        retry_state.outcome.exception(),
+        retry_state.next_action.sleep,
     )
 
-# Configure httpx timeouts and limits
+@lru_cache(maxsize=64)
+def _host(url: str) -> str:
+    # Upstream URLs come from settings, so each distinct URL is parsed once per process.
+    return urlparse(url).netloc
+
+# Per-request timeouts; connections come from the shared client's pool
 HTTP_TIMEOUT = httpx.Timeout(5.0, read=10.0, write=5.0, pool=5.0)
-HTTP_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=5)
 
 class OnchainAgentException(Exception):
     """Base exception for OnchainAgent errors."""
@@ -75,41 +84,38 @@ async def fetch_onchain_metrics(url: str, token_id: str, params: dict | None = N
         OnchainAgentHTTPError: If the HTTP response status is not 2xx.
         OnchainAgentException: For other unexpected errors.
     """
-    logger.info(f"OnchainAgent: Starting fetch_onchain_metrics for token_id: {token_id}, URL: {url}")
+    logger.info("OnchainAgent: Starting fetch_onchain_metrics for token_id: %s, URL: %s", token_id, url)
     if params is None:
         params = {}
 
-    logger.info(f"[Token ID: {token_id}] Initiating API call to {url} with params: {params}")
+    logger.info("[Token ID: %s] Initiating API call to %s with params: %s", token_id, url, params)
 
     if not rate_limiter.check_rate_limit("onchain_agent"):
-        logger.warning(f"[Token ID: {token_id}] Rate limit exceeded for onchain_agent.")
+        logger.warning("[Token ID: %s] Rate limit exceeded for onchain_agent.", token_id)
         raise OnchainAgentRateLimitExceeded()
 
-    async with httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS, headers={"User-Agent": settings.USER_AGENT}) as client:
-        try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            response_json = response.json()
-            output_size = len(response.content)
-            logger.info(f"[Token ID: {token_id}] API call to {url} successful. Status: {response.status_code}, Response size: {output_size} bytes")
-            await asyncio.sleep(settings.REQUEST_DELAY_SECONDS)
-            logger.info(f"OnchainAgent: Completed fetch_onchain_metrics for token_id: {token_id}, URL: {url}")
-            return response_json
-        except httpx.TimeoutException as e:
-            logger.error(f"[Token ID: {token_id}] Timeout fetching on-chain metrics from {url}: {e}")
-            raise OnchainAgentTimeout(f"Request to {url} timed out.") from e
-        except httpx.RequestError as e:
-            logger.error(f"[Token ID: {token_id}] Network error fetching on-chain metrics from {url}: {e}")
-            raise OnchainAgentNetworkError(f"Network error for {url}: {e}") from e
-        except httpx.HTTPStatusError as e:
-            logger.error(f"[Token ID: {token_id}] HTTP error fetching on-chain metrics from {url}: {e.response.status_code}. Response text truncated: {e.response.text[:200]}")
-            raise OnchainAgentHTTPError(f"HTTP error for {url}: {e.response.status_code}", e.response.status_code) from e
-        except Exception as e:
-            logger.exception(
-                f"[Token ID: {token_id}] An unexpected error occurred while "
-                f"fetching on-chain metrics from {url}"
-            )
-            raise OnchainAgentException(f"Unexpected error for {url}") from e
+    client = get_http_client()
+    try:
+        async with host_limiter.acquire(_host(url)):
+            response = await client.get(url, params=params, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+        response_json = response.json()
+        output_size = len(response.content)
+        logger.info("[Token ID: %s] API call to %s successful. Status: %s, Response size: %s bytes", token_id, url, response.status_code, output_size)
+        logger.info("OnchainAgent: Completed fetch_onchain_metrics for token_id: %s, URL: %s", token_id, url)
+        return response_json
+    except httpx.TimeoutException as e:
+        logger.error("[Token ID: %s] Timeout fetching on-chain metrics from %s: %s", token_id, url, e)
+        raise OnchainAgentTimeout(f"Request to {url} timed out.") from e
+    except httpx.RequestError as e:
+        logger.error("[Token ID: %s] Network error fetching on-chain metrics from %s: %s", token_id, url, e)
+        raise OnchainAgentNetworkError(f"Network error for {url}: {e}") from e
+    except httpx.HTTPStatusError as e:
+        logger.error("[Token ID: %s] HTTP error fetching on-chain metrics from %s: %s. Response text truncated: %s", token_id, url, e.response.status_code, e.response.text[:200])
+        raise OnchainAgentHTTPError(f"HTTP error for {url}: {e.response.status_code}", e.response.status_code) from e
+    except Exception as e:
+        logger.exception("[Token ID: %s] An unexpected error occurred while fetching on-chain metrics from %s", token_id, url)
+        raise OnchainAgentException(f"Unexpected error for {url}") from e
 
 @retry(
     stop=stop_after_attempt(settings.MAX_RETRIES),
@@ -136,38 +142,35 @@ async def fetch_tokenomics(url: str, token_id: str, params: dict | None = None)
         OnchainAgentHTTPError: If the HTTP response status is not 2xx.
         OnchainAgentException: For other unexpected errors.
     """
-    logger.info(f"OnchainAgent: Starting fetch_tokenomics for token_id: {token_id}, URL: {url}")
+    logger.info("OnchainAgent: Starting fetch_tokenomics for token_id: %s, URL: %s", token_id, url)
     if params is None:
         params = {}
 
-    logger.info(f"[Token ID: {token_id}] Initiating API call to {url} with params: {params}")
+    logger.info("[Token ID: %s] Initiating API call to %s with params: %s", token_id, url, params)
 
     if not rate_limiter.check_rate_limit("onchain_agent"):
-        logger.warning(f"[Token ID: {token_id}] Rate limit exceeded for onchain_agent.")
+        logger.warning("[Token ID: %s] Rate limit exceeded for onchain_agent.", token_id)
         raise OnchainAgentRateLimitExceeded()
 
-    async with httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS, headers={"User-Agent": settings.USER_AGENT}) as client:
-        try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            response_json = response.json()
-            output_size = len(response.content)
-            logger.info(
-                f"[Token ID: {token_id}] API call to {url} successful. "
-                f"Status: {response.status_code}, Response size: {output_size} bytes"
-            )
-            await asyncio.sleep(settings.REQUEST_DELAY_SECONDS)
-            logger.info(f"OnchainAgent: Completed fetch_tokenomics for token_id: {token_id}, URL: {url}")
-            return response_json
-        except httpx.TimeoutException as e:
-            logger.error(f"[Token ID: {token_id}] Timeout fetching tokenomics data from {url}: {e}")
-            raise OnchainAgentTimeout(f"Request to {url} timed out.") from e
-        except httpx.RequestError as e:
-            logger.error(f"[Token ID: {token_id}] Network error fetching tokenomics data from {url}: {e}")
-            raise OnchainAgentNetworkError(f"Network error for {url}: {e}") from e
-        except httpx.HTTPStatusError as e:
-            logger.error(f"[Token ID: {token_id}] HTTP error fetching tokenomics data from {url}: {e.response.status_code}. Response text truncated: {e.response.text[:200]}")
-            raise OnchainAgentHTTPError(f"HTTP error for {url}: {e.response.status_code}", e.response.status_code) from e
-        except Exception as e:
-            logger.exception(f"[Token ID: {token_id}] An unexpected error occurred while fetching tokenomics data from {url}")
-            raise OnchainAgentException(f"Unexpected error for {url}") from e
+    client = get_http_client()
+    try:
+        async with host_limiter.acquire(_host(url)):
+            response = await client.get(url, params=params, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+        response_json = response.json()
+        output_size = len(response.content)
+        logger.info("[Token ID: %s] API call to %s successful. Status: %s, Response size: %s bytes", token_id, url, response.status_code, output_size)
+        logger.info("OnchainAgent: Completed fetch_tokenomics for token_id: %s, URL: %s", token_id, url)
+        return response_json
+    except httpx.TimeoutException as e:
+        logger.error("[Token ID: %s] Timeout fetching tokenomics data from %s: %s", token_id, url, e)
+        raise OnchainAgentTimeout(f"Request to {url} timed out.") from e
+    except httpx.RequestError as e:
+        logger.error("[Token ID: %s] Network error fetching tokenomics data from %s: %s", token_id, url, e)
+        raise OnchainAgentNetworkError(f"Network error for {url}: {e}") from e
+    except httpx.HTTPStatusError as e:
+        logger.error("[Token ID: %s] HTTP error fetching tokenomics data from %s: %s. Response text truncated: %s", token_id, url, e.response.status_code, e.response.text[:200])
+        raise OnchainAgentHTTPError(f"HTTP error for {url}: {e.response.status_code}", e.response.status_code) from e
+    except Exception as e:
+        logger.exception("[Token ID: %s] An unexpected error occurred while fetching tokenomics data from %s", token_id, url)
+        raise OnchainAgentException(f"Unexpected error for {url}") from e
@@ -1,10 +1,10 @@
-import os
 import asyncio
 from typing import List, Dict, Any
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type, RetryError
 from textblob import TextBlob
 
+from backend.app.core.config import settings
 from backend.app.core.logger import services_logger
 from backend.app.security.rate_limiter import rate_limiter
 
@@ -39,10 +39,10 @@ class SocialSentimentAgent:
     POSITIVE_THRESHOLD = 0.1
     NEGATIVE_THRESHOLD = -0.1
     def __init__(self):
-        # Load API keys from environment variables or secrets manager
-        self.twitter_api_key = os.getenv("TWITTER_API_KEY")
-        self.reddit_api_key = os.getenv("REDDIT_API_KEY")
-        self.news_api_key = os.getenv("NEWS_API_KEY")
+        # API keys come from the shared settings, loaded once per process
+        self.twitter_api_key = settings.TWITTER_API_KEY
+        self.reddit_api_key = settings.REDDIT_API_KEY
+        self.news_api_key = settings.NEWS_API_KEY
 
     @api_retry_decorator
     async def _fetch_twitter_data(self, token_id: str) -> List[Dict[str, Any]]:
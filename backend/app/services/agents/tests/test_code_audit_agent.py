@@ -1,6 +1,7 @@
 import pytest
 import pytest_asyncio
 import respx
+from unittest.mock import patch
 from httpx import Response, Request, RequestError
 from backend.app.services.agents.code_audit_agent import CodeAuditAgent, CodeMetrics, AuditSummary
 
@@ -241,4 +242,20 @@ async def test_fetch_repo_metrics_invalid_gitlab_url_format(code_audit_agent):
     assert metrics.contributors_count == 0
     assert metrics.latest_release == "N/A"
     assert metrics.issues_count == 0
-    assert metrics.pull_requests_count == 0
\ No newline at end of file
+    assert metrics.pull_requests_count == 0
+
+@pytest.mark.asyncio
+async def test_fetch_repo_metrics_goes_through_host_limiter(code_audit_agent):
+    repo_url = "https://github.com/octocat/limited-repo"
+
+    async def bypass_cache(url, external_api_call, **kwargs):
+        return await external_api_call()
+
+    with respx.mock, patch("backend.app.services.agents.code_audit_agent.host_limiter") as mock_host_limiter, \
+         patch("backend.app.services.agents.code_audit_agent.cache_request", new=bypass_cache), \
+         patch("backend.app.services.agents.code_audit_agent.rate_limiter.check_rate_limit", return_value=True):
+        respx.get(url__startswith="https://api.github.com/").mock(return_value=Response(200, json={"total_count": 0}))
+        await code_audit_agent.fetch_repo_metrics(repo_url)
+
+    hosts = [call.args[0] for call in mock_host_limiter.acquire.call_args_list]
+    assert hosts == ["api.github.com"] * 5
@@ -26,10 +26,10 @@ def create_mock_response(status_code: int, json_data: dict = None, text_data: st
     return mock_response
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_onchain_metrics_retry_on_timeout(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
 
     with patch.object(fetch_onchain_metrics.retry, 'wait', new=wait_fixed(0.01)), \
          patch.object(fetch_onchain_metrics.retry, 'stop', new=stop_after_attempt(3)):
@@ -46,10 +46,10 @@ async def test_fetch_onchain_metrics_retry_on_timeout(mock_async_client):
         assert mock_client_instance.get.call_count == 3
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_onchain_metrics_retry_on_network_error(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
 
     # Simulate 2 network errors, then success
     mock_client_instance.get.side_effect = [
@@ -66,10 +66,10 @@ async def test_fetch_onchain_metrics_retry_on_network_error(mock_async_client):
         assert mock_client_instance.get.call_count == 3
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_onchain_metrics_retry_on_http_error(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
 
     # Simulate 2 HTTP 500 errors, then success
     mock_client_instance.get.side_effect = [
@@ -86,10 +86,10 @@ async def test_fetch_onchain_metrics_retry_on_http_error(mock_async_client):
         assert mock_client_instance.get.call_count == 3
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_onchain_metrics_max_retries_exceeded(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
 
     # Simulate 3 timeouts, exceeding retry limit
     mock_client_instance.get.side_effect = [
@@ -106,10 +106,10 @@ async def test_fetch_onchain_metrics_max_retries_exceeded(mock_async_client):
         assert mock_client_instance.get.call_count == 3
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_onchain_metrics_retry_on_rate_limit(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
 
     # Simulate 2 HTTP 429 errors, then success
     mock_client_instance.get.side_effect = [
@@ -126,10 +126,10 @@ async def test_fetch_onchain_metrics_retry_on_rate_limit(mock_async_client):
         assert mock_client_instance.get.call_count == 3
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_tokenomics_retry_on_rate_limit(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
 
     # Simulate 2 HTTP 429 errors, then success
     mock_client_instance.get.side_effect = [
@@ -146,10 +146,10 @@ async def test_fetch_tokenomics_retry_on_rate_limit(mock_async_client):
         assert mock_client_instance.get.call_count == 3
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_tokenomics_retry_on_timeout(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
 
     # Simulate 2 timeouts, then success
     mock_client_instance.get.side_effect = [
@@ -166,10 +166,10 @@ async def test_fetch_tokenomics_retry_on_timeout(mock_async_client):
         assert mock_client_instance.get.call_count == 3
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_tokenomics_max_retries_exceeded(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
 
     # Simulate 3 network errors, exceeding retry limit
     mock_client_instance.get.side_effect = [
@@ -186,10 +186,10 @@ async def test_fetch_tokenomics_max_retries_exceeded(mock_async_client):
         assert mock_client_instance.get.call_count == 3
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_onchain_metrics_http_error_raises_onchainagenthttperror(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
     mock_client_instance.get.side_effect = [
         create_mock_response(404),
         create_mock_response(404),
@@ -204,10 +204,10 @@ async def test_fetch_onchain_metrics_http_error_raises_onchainagenthttperror(moc
         assert mock_client_instance.get.call_count == 3 # Retries should still happen
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_onchain_metrics_unexpected_error_raises_onchainagentexception(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
     mock_client_instance.get.side_effect = [
         Exception("Unexpected error"),
         Exception("Unexpected error"),
@@ -221,10 +221,10 @@ async def test_fetch_onchain_metrics_unexpected_error_raises_onchainagentexcepti
         assert mock_client_instance.get.call_count == 3 # Retries should still happen
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_tokenomics_http_error_raises_onchainagenthttperror(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
     mock_client_instance.get.side_effect = [
         create_mock_response(403),
         create_mock_response(403),
@@ -239,10 +239,10 @@ async def test_fetch_tokenomics_http_error_raises_onchainagenthttperror(mock_asy
         assert mock_client_instance.get.call_count == 3 # Retries should still happen
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_tokenomics_unexpected_error_raises_onchainagentexception(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
     mock_client_instance.get.side_effect = [
         Exception("Another unexpected error"),
         Exception("Another unexpected error"),
@@ -258,10 +258,10 @@ async def test_fetch_tokenomics_unexpected_error_raises_onchainagentexception(mo
 # --- New tests for successful fetching and schema validation ---
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_onchain_metrics_success_and_schema(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
 
     expected_metrics = {
         "total_transactions": 1000,
@@ -283,10 +283,10 @@ async def test_fetch_onchain_metrics_success_and_schema(mock_async_client):
     assert isinstance(result["timestamp"], str)
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_tokenomics_success_and_schema(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
 
     expected_tokenomics = {
         "total_supply": "1000000000",
@@ -313,10 +313,10 @@ async def test_fetch_tokenomics_success_and_schema(mock_async_client):
 # --- New tests for handling missing fields ---
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_onchain_metrics_missing_fields(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
 
     # Simulate a response with some missing fields
     incomplete_metrics = {
@@ -334,10 +334,10 @@ async def test_fetch_onchain_metrics_missing_fields(mock_async_client):
     assert "timestamp" in result
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_tokenomics_missing_fields(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
 
     # Simulate a response with some missing fields
     incomplete_tokenomics = {
@@ -357,10 +357,10 @@ async def test_fetch_tokenomics_missing_fields(mock_async_client):
 # --- New tests for invalid token IDs (simulated via API response) ---
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_onchain_metrics_invalid_token_id(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
 
     # Simulate an API response indicating an invalid token ID (e.g., 400 Bad Request)
     error_response_data = {"error": "Invalid token ID provided"}
@@ -371,10 +371,10 @@ async def test_fetch_onchain_metrics_invalid_token_id(mock_async_client):
     assert excinfo.value.status_code == 400
 
 @pytest.mark.asyncio
-@patch('httpx.AsyncClient')
+@patch('backend.app.services.agents.onchain_agent.get_http_client')
 async def test_fetch_tokenomics_invalid_token_id(mock_async_client):
     mock_client_instance = AsyncMock()
-    mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+    mock_async_client.return_value = mock_client_instance
 
     # Simulate an API response indicating an invalid token ID (e.g., 404 Not Found)
     error_response_data = {"message": "Token not found"}
@@ -3,6 +3,8 @@ import httpx
 from typing import Dict, Any
 import logging
 
+from backend.app.core.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,16 +22,15 @@ class LLMClient:
         self._client: httpx.AsyncClient | None = None
 
     async def __aenter__(self):
-        self._client = httpx.AsyncClient(timeout=self.timeout, headers=self.headers)
+        self._client = get_http_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._client:
-            await self._client.aclose()
+        self._client = None
 
     async def generate_text(self, prompt: str, model: str = "gpt-4o") -> Dict[str, Any]:
         if not self._client:
-            raise RuntimeError("LLMClient must be used as an async context manager or client must be explicitly opened.")
+            raise RuntimeError("LLMClient must be used as an async context manager.")
 
         payload = {
             "model": model,
@@ -40,7 +41,9 @@ class LLMClient:
         try:
             response = await self._client.post(
                 self.base_url,
-                json=payload
+                json=payload,
+                headers=self.headers,
+                timeout=self.timeout
             )
             response.raise_for_status()  # Raise an exception for HTTP errors
             return response.json()
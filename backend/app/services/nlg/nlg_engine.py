@@ -71,15 +71,15 @@ class NLGEngine(ABC):
             },
         ]
 
-        tasks = []
+        coros = []
         for section_info in sections_to_generate:
             if section_info["section_id"] == "code_audit_summary":
                 # Handle code_audit_summary with two arguments
-                tasks.append(asyncio.create_task(section_info["generator"](*section_info["data"])))
+                coros.append(section_info["generator"](*section_info["data"]))
             else:
-                tasks.append(asyncio.create_task(section_info["generator"](section_info["data"])))
+                coros.append(section_info["generator"](section_info["data"]))
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*coros, return_exceptions=True)
 
         sections = []
         for i, result in enumerate(results):
@@ -88,7 +88,7 @@ class NLGEngine(ABC):
             fallback_dict = section_info["fallback"]
 
             if isinstance(result, Exception):
-                logger.error(f"Error generating {section_id} section: {result}", exc_info=True)
+                logger.error("Error generating %s section: %s", section_id, result, exc_info=result)
                 sections.append(fallback_dict)
             else:
                 try:
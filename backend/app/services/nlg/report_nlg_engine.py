@@ -38,7 +38,7 @@ class ReportNLGEngine(BaseNLGEngine):
             {"section_id": "team_documentation", "data_key": "team_documentation", "generator": self.generate_team_documentation_text},
         ]
 
-        tasks = []
+        coros = []
         for section_info in sections_to_generate:
             section_id = section_info["section_id"]
             data_key = section_info["data_key"]
@@ -48,17 +48,17 @@ class ReportNLGEngine(BaseNLGEngine):
                 # Assuming data_key[0] maps to code_audit.code_metrics and data_key[1] maps to code_audit.audit_summary
                 code_data = (data.get(data_key[0]) or {}).get("code_metrics", {})
                 audit_data = (data.get(data_key[0]) or {}).get(data_key[1], [])
-                tasks.append(asyncio.create_task(generator(code_data, audit_data)))
+                coros.append(generator(code_data, audit_data))
             else:
                 section_data = data.get(data_key, {})
-                tasks.append(asyncio.create_task(generator(section_data)))
+                coros.append(generator(section_data))
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*coros, return_exceptions=True)
 
         for i, result in enumerate(results):
             section_id = sections_to_generate[i]["section_id"]
             if isinstance(result, Exception):
-                logger.error(f"Error generating {section_id} section: {result}", exc_info=True)
+                logger.error("Error generating %s section: %s", section_id, result, exc_info=result)
                 nlg_outputs[section_id] = f"Failed to generate {section_id} summary due to an internal error."
             else:
                 try:
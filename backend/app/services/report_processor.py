@@ -2,6 +2,7 @@ import asyncio
 import logging
 import time
 from sqlalchemy.ext.asyncio import AsyncSession # Import AsyncSession
+from backend.app.core.config import settings
 from backend.app.core.orchestrator import Orchestrator
 from backend.app.services.agents.price_agent import run as price_agent_run
 from backend.app.services.agents.trend_agent import run as trend_agent_run
@@ -15,6 +16,9 @@ from backend.app.db.models.report_state import ReportStatusEnum # Import ReportS
 logger = logging.getLogger(__name__)
 
 
+class ReportAlreadyProcessingError(ValueError):
+    """Raised when another job already holds the processing claim for a report."""
+
 
 async def process_report(report_id: str, token_id: str, report_repository: ReportRepository) -> bool:
     """
@@ -22,7 +26,7 @@ async def process_report(report_id: str, token_id: str, report_repository: Repor
     Updates report_status to 'processing' and then to 'completed' on success.
 
     Raises:
-        ValueError: If report_id is already being processed.
+        ReportAlreadyProcessingError: If report_id is already being processed.
         Exception: Any underlying exceptions are re-raised after marking status.
     Returns:
         True on success.
@@ -31,15 +35,15 @@ async def process_report(report_id: str, token_id: str, report_repository: Repor
 
     if not try_set_processing(report_id):
         logger.info("Report %s is already being processed, skipping.", report_id)
-        raise ValueError(f"Report {report_id} is already being processed")
+        raise ReportAlreadyProcessingError(f"Report {report_id} is already being processed")
 
     logger.info("Processing report %s for token %s", report_id, token_id)
     start_time = time.monotonic()
     try:
-        orchestrator = Orchestrator(report_repository.session)
-        orchestrator.register_agent("price_agent", price_agent_run)
-        orchestrator.register_agent("trend_agent", trend_agent_run)
-        orchestrator.register_agent("volume_agent", volume_agent_run)
+        orchestrator = Orchestrator(report_repository.session_factory)
+        orchestrator.register_agent("price_agent", price_agent_run, max_retries=settings.AGENT_MAX_RETRIES)
+        orchestrator.register_agent("trend_agent", trend_agent_run, max_retries=settings.AGENT_MAX_RETRIES)
+        orchestrator.register_agent("volume_agent", volume_agent_run, max_retries=settings.AGENT_MAX_RETRIES)
 
         agent_results = await orchestrator.execute_agents(report_id, token_id)
         combined_report_data = orchestrator.aggregate_results(agent_results)
@@ -68,12 +72,15 @@ async def process_report(report_id: str, token_id: str, report_repository: Repor
             scores = summary_engine.generate_scores(scores_input)
 
             agent_errors = {}
+            any_agent_failed = False
             for agent_name, result in agent_results.items():
-                if result.get("status") == ReportStatusEnum.FAILED.value and result.get("error"):
-                    agent_errors[agent_name] = {
-                        "timestamp": result.get("timestamp"), # Assuming timestamp is part of the agent result
-                        "error_message": result.get("error")
-                    }
+                if result.get("status") == ReportStatusEnum.FAILED.value:
+                    any_agent_failed = True
+                    if result.get("error"):
+                        agent_errors[agent_name] = {
+                            "timestamp": result.get("timestamp"), # Assuming timestamp is part of the agent result
+                            "error_message": result.get("error")
+                        }
 
             final_narrative_summary = summary_engine.build_final_summary(nlg_outputs, scores, agent_errors)
             await report_repository.update_report_status(report_id, ReportStatusEnum.SUMMARY_COMPLETED)
@@ -84,7 +91,7 @@ async def process_report(report_id: str, token_id: str, report_repository: Repor
 
         # Determine overall status based on agent results
         overall_status = ReportStatusEnum.COMPLETED
-        if any(result.get("status") == ReportStatusEnum.FAILED.value for result in agent_results.values()):
+        if any_agent_failed:
             overall_status = ReportStatusEnum.FAILED
             logger.error("Report %s completed with failures from one or more agents.", report_id)
 
@@ -1,3 +1,5 @@
+import time
+from collections import OrderedDict
 from backend.app.models.report_models import ReportRequest, ReportResponse
 from backend.app.utils.id_generator import generate_report_id
 from typing import Dict, Any
@@ -11,11 +13,44 @@ async def generate_report(request: ReportRequest, report_repository: ReportRepos
     await report_repository.create_report_entry(report_id)
     return ReportResponse(report_id=report_id, status=ReportStatusEnum.PENDING.value)
 
+# Short-lived in-process cache for status polling. Status writes happen in the
+# report worker, so entries expire on their own instead of being invalidated:
+# in-flight statuses live for about a second, final ones for a minute. FAILED
+# stays short-lived because the worker may retry the report.
+_STATUS_CACHE_MAXSIZE = 10_000
+_STATUS_TTL_IN_PROGRESS = 1.0
+_STATUS_TTL_FINAL = 60.0
+_FINAL_STATUSES = frozenset({ReportStatusEnum.COMPLETED, ReportStatusEnum.TIMED_OUT})
+_STATUS_CACHE: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+def _status_cache_get(report_id: str) -> Dict[str, Any] | None:
+    entry = _STATUS_CACHE.get(report_id)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at <= time.monotonic():
+        del _STATUS_CACHE[report_id]
+        return None
+    _STATUS_CACHE.move_to_end(report_id)
+    return value
+
+def _status_cache_put(report_id: str, value: Dict[str, Any], ttl: float):
+    _STATUS_CACHE[report_id] = (time.monotonic() + ttl, value)
+    _STATUS_CACHE.move_to_end(report_id)
+    if len(_STATUS_CACHE) > _STATUS_CACHE_MAXSIZE:
+        _STATUS_CACHE.popitem(last=False)
+
 async def get_report_status(report_id: str, report_repository: ReportRepository) -> Dict[str, Any] | None:
+    cached = _status_cache_get(report_id)
+    if cached is not None:
+        return cached
     services_logger.info(f"Retrieving status for report_id: {report_id} from database.")
     report = await report_repository.get_report_state(report_id)
     if report:
-        return {"report_id": report.report_id, "status": report.status.value}
+        result = {"report_id": report.report_id, "status": report.status.value}
+        ttl = _STATUS_TTL_FINAL if report.status in _FINAL_STATUSES else _STATUS_TTL_IN_PROGRESS
+        _status_cache_put(report_id, result, ttl)
+        return result
     return None
 
 async def get_report_data(report_id: str, report_repository: ReportRepository) -> Dict[str, Any] | None:
@@ -28,6 +63,7 @@ async def get_report_data(report_id: str, report_repository: ReportRepository) -
         services_logger.info(f"Report {report_id} is completed, returning data.")
         return {
             "report_id": report.report_id,
+            "status": report.status.value,
             "data": report.final_report_json if report.final_report_json else report.partial_agent_output,
         }
     services_logger.info(f"Report {report_id} is in status: {report.status.value}, returning status only.")
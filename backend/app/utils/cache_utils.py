@@ -1,16 +1,17 @@
-import os
 import hashlib
 import json
 import logging
+import orjson
 from typing import Any, Awaitable, Callable, Dict, Optional
 
 from redis.exceptions import RedisError
 
 from backend.app.cache.redis_client import redis_client
+from backend.app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-CACHE_TTL = int(os.getenv("REDIS_CACHE_TTL", 3600))  # Cache time-to-live in seconds (1 hour)
+CACHE_TTL = settings.REDIS_CACHE_TTL  # Cache time-to-live in seconds
 
 
 def _generate_cache_key(url: str, params: Optional[Dict[str, Any]]) -> str:
@@ -24,19 +25,19 @@ async def cache_request(
     url: str,
     params: Optional[Dict[str, Any]] = None,
     external_api_call: Optional[Callable[[], Awaitable[Any]]] = None,
-    serializer: Callable[[Any], str] = json.dumps,
-    deserializer: Callable[[str], Any] = json.loads,
+    serializer: Callable[[Any], bytes | str] = orjson.dumps,
+    deserializer: Callable[[bytes | str], Any] = orjson.loads,
 ) -> Any:
     """
     Checks Redis cache before making an external API call.
     Stores hashed request keys and responses with TTL values.
-    Accepts optional `serializer` and `deserializer` callables (defaulting to `json.dumps`/`json.loads`)
+    Accepts optional `serializer` and `deserializer` callables (defaulting to `orjson.dumps`/`orjson.loads`)
     to handle complex object types consistently.
     If serialization fails, logs the error and skips caching, returning the original response.
     """
     cache_key = _generate_cache_key(url, params)
     try:
-        cached_response = redis_client.get_cache(cache_key)
+        cached_response = await redis_client.get_cache(cache_key)
         if cached_response:
             try:
                 return deserializer(cached_response)
@@ -52,7 +53,7 @@ async def cache_request(
         try:
             # Attempt to serialize the response before caching
             serialized_response = serializer(response)
-            redis_client.set_cache(cache_key, serialized_response, CACHE_TTL)
+            await redis_client.set_cache(cache_key, serialized_response, CACHE_TTL)
         except (TypeError, ValueError) as e:
             logger.warning(f"Failed to serialize response for caching (key: {cache_key}): {e}. Skipping cache."
             )
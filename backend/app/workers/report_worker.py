@@ -0,0 +1,121 @@
+"""
+arq worker that runs the report pipeline outside the API process.
+
+Start a worker with:
+
+    python -m backend.app.workers.report_worker
+
+which runs it on uvloop when available. The plain arq CLI
+(`arq backend.app.workers.report_worker.WorkerSettings`) also works but uses
+the default event loop.
+"""
+import asyncio
+import logging
+
+from arq import Retry, create_pool, run_worker
+from arq.connections import ArqRedis, RedisSettings
+
+from backend.app.core.config import settings
+from backend.app.core.http_client import close_http_client
+from backend.app.core.logging_config import set_report_context
+from backend.app.core.storage import set_report_status
+from backend.app.db.database import get_db
+from backend.app.db.models.report_state import ReportStatusEnum
+from backend.app.db.repositories.report_repository import ReportRepository
+from backend.app.services.report_processor import ReportAlreadyProcessingError, process_report
+
+logger = logging.getLogger(__name__)
+
+REDIS_SETTINGS = RedisSettings(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    database=settings.REDIS_DB,
+    password=settings.REDIS_PASSWORD,
+)
+
+_pool: ArqRedis | None = None
+_pool_lock = asyncio.Lock()
+
+
+async def get_pool() -> ArqRedis:
+    """Returns the process-wide arq pool used to enqueue jobs, creating it on first use."""
+    global _pool
+    if _pool is None:
+        async with _pool_lock:
+            if _pool is None:
+                _pool = await create_pool(REDIS_SETTINGS)
+    return _pool
+
+
+async def close_pool():
+    global _pool
+    if _pool is not None:
+        await _pool.aclose()
+        _pool = None
+
+
+async def enqueue(function: str, *args):
+    """Enqueues `function` for execution by a report worker."""
+    pool = await get_pool()
+    return await pool.enqueue_job(function, *args)
+
+
+def _retry_delay(job_try: int) -> float:
+    delay = settings.RETRY_MULTIPLIER * 2 ** (job_try - 1)
+    return min(settings.MAX_RETRY_DELAY, max(settings.MIN_RETRY_DELAY, delay))
+
+
+async def _mark_failed(report_id: str, error_message: str):
+    try:
+        async for session in get_db():
+            report_repository = ReportRepository(session)
+            await report_repository.update_partial(report_id, {"status": ReportStatusEnum.FAILED, "error_message": error_message})
+    except Exception:
+        logger.exception("Failed to mark report %s as failed", report_id)
+
+
+async def run_report_pipeline(ctx: dict, report_id: str, token_id: str):
+    job_try = ctx.get("job_try", 1)
+    # Each arq job runs in its own task, so the context never leaks between jobs.
+    set_report_context(report_id, token_id)
+    try:
+        async for session in get_db():
+            report_repository = ReportRepository(session)
+            await report_repository.update_report_status(report_id, ReportStatusEnum.RUNNING_AGENTS)
+            await process_report(report_id, token_id, report_repository)
+            await report_repository.update_report_status(report_id, ReportStatusEnum.COMPLETED)
+    except asyncio.CancelledError:
+        raise
+    except ReportAlreadyProcessingError:
+        # The claim belongs to the job that is still running; leave it alone and drop this duplicate.
+        logger.info("Report %s is already being processed by another job, dropping duplicate.", report_id)
+    except Exception as e:
+        # Release the in-process claim so a retry on this worker is not rejected as a duplicate.
+        set_report_status(report_id, "failed")
+        if job_try < settings.MAX_RETRIES:
+            delay = _retry_delay(job_try)
+            logger.warning("Report %s failed on attempt %s, retrying in %.1fs: %s", report_id, job_try, delay, e)
+            raise Retry(defer=delay) from e
+        logger.error("Report processing failed for report %s after %s attempts: %s", report_id, job_try, e)
+        await _mark_failed(report_id, str(e))
+
+
+async def shutdown(ctx: dict):
+    await close_http_client()
+
+
+class WorkerSettings:
+    functions = [run_report_pipeline]
+    on_shutdown = shutdown
+    redis_settings = REDIS_SETTINGS
+    max_tries = settings.MAX_RETRIES
+
+
+if __name__ == "__main__":
+    try:
+        import uvloop
+    except ImportError:  # uvloop is not available on Windows
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    run_worker(WorkerSettings)
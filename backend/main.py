@@ -1,21 +1,41 @@
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from backend.app.core.config import settings
 from backend.app.api.v1.routes import router as v1_router
 from backend.app.core.exceptions import ReportNotFoundException, AgentExecutionException
 from backend.app.core.logger import api_logger
 from backend.app.core.orchestrator import create_orchestrator, Orchestrator
+from backend.app.workers import report_worker
+from backend.app.cache.redis_client import close_redis_pool
+from backend.app.core.http_client import get_http_client, close_http_client
 
 from dotenv import load_dotenv
 
-import os
+from contextlib import asynccontextmanager
 
 load_dotenv()
 
-app = FastAPI(title=settings.APP_NAME, debug=settings.DEBUG)
-
 orchestrator_instance: Orchestrator | None = None
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global orchestrator_instance
+    # Build the orchestrator once per worker process; reloads reuse the existing instance.
+    if orchestrator_instance is None:
+        orchestrator_instance = await create_orchestrator()
+        api_logger.info("Orchestrator instance initialized.")
+
+    # Create the report output directory once, so request handlers never need to check for it.
+    settings.REPORT_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    api_logger.info(f"Report output directory '{settings.REPORT_OUTPUT_DIR}' ensured to exist.")
+    app.state.http = get_http_client()
+    yield
+    await report_worker.close_pool()
+    await close_redis_pool()
+    await close_http_client()
+
+app = FastAPI(title=settings.APP_NAME, debug=settings.DEBUG, lifespan=lifespan, default_response_class=ORJSONResponse)
+
 @app.exception_handler(ReportNotFoundException)
 async def report_not_found_exception_handler(request: Request, exc: ReportNotFoundException):
     api_logger.error(f"ReportNotFoundException: {exc.detail}")
@@ -62,16 +82,6 @@ async def generic_exception_handler(request: Request, exc: Exception):
 
 app.include_router(v1_router, prefix="/api/v1")
 
-@app.on_event("startup")
-async def startup_event():
-    global orchestrator_instance
-    orchestrator_instance = await create_orchestrator()
-    api_logger.info("Orchestrator instance initialized.")
-    
-    # Create the report output directory if it doesn't exist
-    os.makedirs(settings.REPORT_OUTPUT_DIR, exist_ok=True)
-    api_logger.info(f"Report output directory '{settings.REPORT_OUTPUT_DIR}' ensured to exist.")
-
 @app.get("/health")
 async def health_check():
     return {"status": "ok"}
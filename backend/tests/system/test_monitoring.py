@@ -1,3 +1,5 @@
+import time
+
 import pytest
 from unittest.mock import AsyncMock, patch
 from datetime import datetime, timezone
@@ -89,6 +91,7 @@ def mock_redis_client():
         mock_redis.set_cache.return_value = None
         mock_redis.get_cache.return_value = None
         mock_redis.delete_cache.return_value = None
+        mock_redis.pop_cache.return_value = None
         yield mock_redis
 
 @pytest.mark.asyncio
@@ -166,14 +169,15 @@ async def test_time_tracker_slow_operation(caplog, mock_session_factory, mock_re
             mock_repo_instance.update_timing_alerts = AsyncMock()
 
             # Mock Redis to simulate start_timer
-            mock_redis_client.get_cache.return_value = datetime.now().isoformat().encode('utf-8')
+            mock_redis_client.pop_cache.return_value = str(time.time_ns()).encode()
 
             # Start timer explicitly (orchestrator doesn't call this directly)
-            time_tracker.start_timer(report_id)
+            await time_tracker.start_timer(report_id)
             mock_redis_client.set_cache.assert_called_once_with(
                 f"report_timer:{report_id}",
-                                datetime.now(timezone.utc).isoformat(),
-                                ttl=3600 * 24        )
+                str(time.time_ns()),
+                ttl=3600 * 24
+            )
 
             # Advance time by more than 5 minutes for the finish_timer call
             freezer.move_to("2025-01-01 12:05:01") # 5 minutes and 1 second later
@@ -183,8 +187,7 @@ async def test_time_tracker_slow_operation(caplog, mock_session_factory, mock_re
                 duration = await time_tracker.finish_timer(report_id, mock_session_factory())
 
                 assert duration > 300
-                mock_redis_client.get_cache.assert_called_with(f"report_timer:{report_id}")
-                mock_redis_client.delete_cache.assert_called_with(f"report_timer:{report_id}")
+                mock_redis_client.pop_cache.assert_called_with(f"report_timer:{report_id}")
 
                 # Verify warning log
                 assert any(f"Report {report_id} processing time exceeded 5 minutes" in r.message for r in caplog.records)
@@ -0,0 +1,42 @@
+from datetime import datetime
+from unittest.mock import patch
+
+from backend.app.core.error_utils import capture_exception
+
+
+def _raise_and_capture(context):
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        return capture_exception(e, context)
+
+
+def test_capture_exception_stringifies_unserializable_context():
+    when = datetime(2024, 1, 1)
+    marker = object()
+
+    error = _raise_and_capture({"report_id": "report_1", "attempt": 2, "marker": marker, "nested": {"when": when}})
+
+    assert error["error_type"] == "ValueError"
+    assert error["message"] == "boom"
+    assert error["context"]["report_id"] == "report_1"
+    assert error["context"]["attempt"] == 2
+    assert error["context"]["marker"] == str(marker)
+    assert error["context"]["nested"]["when"] == when.isoformat()
+
+
+def test_capture_exception_limits_frames_outside_debug():
+    def recurse(depth):
+        if depth == 0:
+            raise RuntimeError("deep")
+        recurse(depth - 1)
+
+    with patch("backend.app.core.error_utils.settings.DEBUG", False):
+        try:
+            recurse(20)
+        except RuntimeError as e:
+            error = capture_exception(e, {})
+
+    # The outermost frame (this test) is beyond the innermost five and is never formatted.
+    assert "in test_capture_exception_limits_frames_outside_debug" not in error["stack_trace"]
+    assert error["stack_trace"].rstrip().endswith("RuntimeError: deep")
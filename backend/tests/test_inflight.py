@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from backend.app.core.inflight import InflightRequests
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_with_same_key_share_one_call():
+    inflight = InflightRequests()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"price": 1}
+
+    results = await asyncio.gather(*(inflight.run(("tokenomics", "eth"), fetch) for _ in range(5)))
+
+    assert calls == 1
+    assert results == [{"price": 1}] * 5
+
+
+@pytest.mark.asyncio
+async def test_key_is_released_after_completion():
+    inflight = InflightRequests()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await inflight.run("key", fetch) == 1
+    assert await inflight.run("key", fetch) == 2
+
+
+@pytest.mark.asyncio
+async def test_exception_is_shared_and_cancelled_caller_does_not_cancel_others():
+    inflight = InflightRequests()
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        raise ValueError("upstream down")
+
+    first = asyncio.create_task(inflight.run("key", fetch))
+    second = asyncio.create_task(inflight.run("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    with pytest.raises(ValueError, match="upstream down"):
+        await second
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_ttl_keeps_successful_results_until_expiry():
+    inflight = InflightRequests()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await inflight.run("key", fetch, ttl=60) == 1
+    assert await inflight.run("key", fetch, ttl=60) == 1
+
+    inflight._results["key"] = (0, 1)  # expire the entry
+    assert await inflight.run("key", fetch, ttl=60) == 2
+
+
+@pytest.mark.asyncio
+async def test_ttl_does_not_cache_failures():
+    inflight = InflightRequests()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        raise ValueError("upstream down")
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await inflight.run("key", fetch, ttl=60)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_ttl_skips_results_rejected_by_cache_if():
+    inflight = InflightRequests()
+    results = iter([[], ["data"]])
+
+    async def fetch():
+        return next(results)
+
+    assert await inflight.run("key", fetch, ttl=60, cache_if=bool) == []
+    assert await inflight.run("key", fetch, ttl=60, cache_if=bool) == ["data"]
+    assert await inflight.run("key", fetch, ttl=60, cache_if=bool) == ["data"]
@@ -0,0 +1,58 @@
+import asyncio
+import logging
+import orjson
+
+import pytest
+
+from backend.app.core.logging_config import JsonFormatter, ReportContextFilter, configure_logging, set_report_context
+
+
+def _record(msg, args=None):
+    return logging.LogRecord("test", logging.INFO, __file__, 10, msg, args, None)
+
+
+def test_json_formatter_merges_extra_fields():
+    record = _record("Processed %s", ("report_1",))
+    record.report_id = "report_1"
+
+    entry = orjson.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "Processed report_1"
+    assert entry["report_id"] == "report_1"
+    assert entry["level"] == "INFO"
+    assert entry["timestamp"].endswith("Z")
+
+
+def test_json_formatter_uses_dict_messages_as_payload():
+    entry = orjson.loads(JsonFormatter().format(_record({"event": "download", "report_id": "report_1"})))
+
+    assert entry["event"] == "download"
+    assert entry["report_id"] == "report_1"
+    assert "message" not in entry
+
+
+def test_configure_logging_is_idempotent():
+    configure_logging()
+    root_handlers = list(logging.getLogger().handlers)
+    downloads_handlers = list(logging.getLogger("downloads").handlers)
+
+    configure_logging()
+
+    assert logging.getLogger().handlers == root_handlers
+    assert logging.getLogger("downloads").handlers == downloads_handlers
+
+
+@pytest.mark.asyncio
+async def test_report_context_filter_tags_records_from_the_current_task_only():
+    async def log_within_report():
+        set_report_context("report_1", "eth")
+        record = _record("Agent finished")
+        ReportContextFilter().filter(record)
+        return record
+
+    tagged = await asyncio.create_task(log_within_report())
+    untagged = _record("Outside any report")
+    ReportContextFilter().filter(untagged)
+
+    assert (tagged.report_id, tagged.token_id) == ("report_1", "eth")
+    assert not hasattr(untagged, "report_id")
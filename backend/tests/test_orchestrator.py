@@ -1,6 +1,9 @@
+import asyncio
+import httpx
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 from backend.app.core.orchestrator import Orchestrator, create_orchestrator
+from backend.app.services.agents.code_audit_agent import CodeAuditAgent, CodeMetrics
 from backend.app.db.models.report_state import ReportStatusEnum, ReportState
 from backend.app.db.repositories.report_repository import ReportRepository
 
@@ -63,13 +66,131 @@ async def test_execute_agents_with_failure(mock_session_factory):
     )
 
 
-def test_get_agents_returns_copy(mock_session_factory):
+def test_get_agents_returns_read_only_view(mock_session_factory):
     orch = Orchestrator(mock_session_factory)
     def func(): pass
     orch.register_agent('a', func)
     got = orch.get_agents()
-    got.clear()
-    assert 'a' in orch.get_agents()
+    with pytest.raises(TypeError):
+        got['b'] = func
+    assert 'b' not in orch.get_agents()
+    assert got['a'] is func
+
+
+def test_register_agent_is_idempotent(mock_session_factory):
+    orch = Orchestrator(mock_session_factory)
+    def first(): pass
+    def second(): pass
+    orch.register_agent('a', first)
+    orch.register_agent('a', second)
+    assert orch.get_agents() == {'a': first}
+
+
+@pytest.mark.asyncio
+async def test_execute_agents_times_out_slow_agent(mock_session_factory):
+    orchestrator = Orchestrator(mock_session_factory)
+    report_id = "test_report_id"
+    orchestrator.report_repository.get_report_by_id = AsyncMock(return_value=ReportState(
+        report_id=report_id, status=ReportStatusEnum.RUNNING, errors={}
+    ))
+    orchestrator.report_repository.update_partial = AsyncMock(return_value=None)
+
+    async def slow_agent(report_id, token_id):
+        await asyncio.sleep(10)
+
+    orchestrator.register_agent("FastAgent", AsyncMock(return_value={"status": "completed", "data": {}}))
+    orchestrator.register_agent("SlowAgent", slow_agent)
+
+    with patch('backend.app.core.orchestrator.settings.AGENT_TIMEOUT', 0.05):
+        results = await orchestrator.execute_agents(report_id, "test_token_id")
+
+    assert results["FastAgent"] == {"status": "completed", "data": {}}
+    assert results["SlowAgent"]["status"] == "failed"
+    orchestrator.report_repository.update_partial.assert_called_with(
+        report_id,
+        {"status": ReportStatusEnum.AGENTS_FAILED, "errors": {"SlowAgent": True}}
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_agents_retries_transient_failures(mock_session_factory):
+    orchestrator = Orchestrator(mock_session_factory)
+    report_id = "test_report_id"
+    orchestrator.report_repository.get_report_by_id = AsyncMock(return_value=ReportState(
+        report_id=report_id, status=ReportStatusEnum.RUNNING, errors={}
+    ))
+    orchestrator.report_repository.update_partial = AsyncMock(return_value=None)
+    flaky_agent = AsyncMock(side_effect=[ConnectionError("reset"), TimeoutError(), {"status": "completed", "data": {}}])
+    broken_agent = AsyncMock(side_effect=ValueError("bad payload"))
+
+    with patch('backend.app.core.orchestrator.settings.MIN_RETRY_DELAY', 0), \
+         patch('backend.app.core.orchestrator.settings.MAX_RETRY_DELAY', 0), \
+         patch('backend.app.core.orchestrator.settings.RETRY_MULTIPLIER', 0):
+        orchestrator.register_agent("FlakyAgent", flaky_agent, max_retries=3)
+        orchestrator.register_agent("BrokenAgent", broken_agent, max_retries=3)
+
+    results = await orchestrator.execute_agents(report_id, "test_token_id")
+
+    assert results["FlakyAgent"] == {"status": "completed", "data": {}}
+    assert flaky_agent.await_count == 3
+    # Non-retriable errors fail on the first attempt.
+    assert results["BrokenAgent"] == {"status": "failed", "error": "bad payload"}
+    assert broken_agent.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_agents_concurrently_limits_workers(mock_session_factory):
+    orchestrator = Orchestrator(mock_session_factory)
+    orchestrator.report_repository.get_report_by_id = AsyncMock(return_value=ReportState(report_id="test_report_id", status=ReportStatusEnum.RUNNING))
+    orchestrator.report_repository.update_partial = AsyncMock(return_value=None)
+
+    running = 0
+    peak = 0
+
+    async def agent(report_id, token_id):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"status": "completed", "data": {}}
+
+    for i in range(5):
+        orchestrator.register_agent(f"Agent{i}", agent)
+
+    results = await orchestrator.execute_agents_concurrently("test_report_id", "test_token_id", num_workers=2)
+
+    assert peak == 2
+    assert list(results) == [f"Agent{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_limits_concurrent_reports(mock_session_factory):
+    orchestrator = Orchestrator(mock_session_factory)
+    orchestrator.report_repository.get_report_by_id = AsyncMock(side_effect=lambda report_id: ReportState(report_id=report_id, status=ReportStatusEnum.RUNNING))
+    orchestrator.report_repository.update_partial = AsyncMock(return_value=None)
+
+    running = 0
+    peak = 0
+
+    async def agent(report_id, token_id):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if report_id == "r2":
+            raise ValueError("boom")
+        return {"status": "completed", "data": {"report": report_id}}
+
+    orchestrator.register_agent("Agent", agent)
+
+    results = await orchestrator.execute_batch([(f"r{i}", "token") for i in range(6)], max_concurrency=3)
+
+    assert peak == 3
+    assert results[0] == {"Agent": {"status": "completed", "data": {"report": "r0"}}}
+    assert results[2]["Agent"]["status"] == "failed"
+    assert len(results) == 6
 
 
 @pytest.mark.asyncio
@@ -85,4 +206,118 @@ async def test_create_orchestrator_with_dummy():
     orch = await create_orchestrator(register_dummy=True, session_factory=mock_session_factory)
     assert 'dummy_agent' in orch.get_agents()
     # Ensure it's callable
-    assert callable(orch.get_agents()['dummy_agent'])
\ No newline at end of file
+    assert callable(orch.get_agents()['dummy_agent'])
+
+@pytest.mark.asyncio
+async def test_code_audit_fetch_survives_cancelled_first_caller():
+    repo_url = "https://github.com/example/coalesced"
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def fetch_repo_metrics(self, url):
+        started.set()
+        await release.wait()
+        # Fails with AttributeError if the agent was closed by another caller.
+        assert self.client is not None
+        return CodeMetrics(repo_url=url)
+
+    async def search_audit_reports(self, url):
+        assert self.client is not None
+        return [{"audit": url}]
+
+    with patch('backend.app.core.orchestrator.settings.CODE_AUDIT_REPO_URL', repo_url), \
+         patch('backend.app.core.orchestrator.settings.AGENT_CACHE_TTL', 0), \
+         patch.object(CodeAuditAgent, 'fetch_repo_metrics', fetch_repo_metrics), \
+         patch.object(CodeAuditAgent, 'search_and_summarize_audit_reports', search_audit_reports):
+        orch = await create_orchestrator(session_factory=AsyncMock())
+        orch.report_repository.get_report_by_id = AsyncMock(return_value=None)
+        orch.report_repository.update_partial = AsyncMock(return_value=None)
+        code_audit_agent = orch.get_agents()['code_audit_agent']
+
+        first = asyncio.create_task(code_audit_agent("r1", "token"))
+        await started.wait()
+        second = asyncio.create_task(code_audit_agent("r2", "token"))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        release.set()
+        result = await second
+
+    assert result["status"] == "completed"
+    assert result["data"]["code_audit"]["code_metrics"]["repo_url"] == repo_url
+    assert result["data"]["code_audit"]["audit_summary"] == [{"audit": repo_url}]
+
+
+@pytest.mark.asyncio
+async def test_team_documentation_agent_merges_existing_partial_output():
+    with patch('backend.app.core.orchestrator.TeamDocAgent.scrape_team_profiles', return_value=[{"name": "Alice"}]), \
+         patch('backend.app.core.orchestrator.TeamDocAgent.analyze_whitepaper', return_value={"summary": "ok"}), \
+         patch('backend.app.core.orchestrator.settings.TEAM_PROFILE_URLS', {"token": ["https://example.com/team"]}), \
+         patch('backend.app.core.orchestrator.settings.WHITEPAPER_TEXT_SOURCES', {"token": "whitepaper text"}):
+        orch = await create_orchestrator(session_factory=AsyncMock())
+        orch.report_repository.get_report_by_id = AsyncMock(return_value=ReportState(
+            report_id="r1", status=ReportStatusEnum.RUNNING, partial_agent_output={"onchain_data_agent": {"status": "completed"}}
+        ))
+        orch.report_repository.update_partial = AsyncMock(return_value=None)
+
+        result = await orch.get_agents()['team_documentation_agent']("r1", "token")
+
+    assert result["status"] == "completed"
+    orch.report_repository.update_partial.assert_awaited_once_with("r1", {"partial_agent_output": {
+        "onchain_data_agent": {"status": "completed"},
+        "team_documentation_agent": result,
+    }})
+
+
+@pytest.mark.asyncio
+async def test_degraded_upstream_fetches_are_not_cached():
+    repo_url = "https://github.com/example/degraded"
+    full_social_data = [{"source": source, "text": "fine"} for source in ("twitter", "reddit", "news")]
+    fetch_social_data = AsyncMock(side_effect=[[], full_social_data, AssertionError("cached result expected")])
+    fetch_repo_metrics = AsyncMock(side_effect=[
+        CodeMetrics(repo_url=repo_url),
+        CodeMetrics(repo_url=repo_url, commits_count=10),
+        AssertionError("cached result expected"),
+    ])
+
+    with patch('backend.app.core.orchestrator.settings.CODE_AUDIT_REPO_URL', repo_url), \
+         patch('backend.app.core.orchestrator.settings.AGENT_CACHE_TTL', 60), \
+         patch('backend.app.core.orchestrator.SocialSentimentAgent.fetch_social_data', fetch_social_data), \
+         patch.object(CodeAuditAgent, 'fetch_repo_metrics', fetch_repo_metrics), \
+         patch.object(CodeAuditAgent, 'search_and_summarize_audit_reports', AsyncMock(return_value=[{"audit": "ok"}])):
+        orch = await create_orchestrator(session_factory=AsyncMock())
+        orch.report_repository.get_report_by_id = AsyncMock(return_value=None)
+        orch.report_repository.update_partial = AsyncMock(return_value=None)
+        agents = orch.get_agents()
+
+        for report_id in ("r1", "r2", "r3"):
+            social = await agents['social_sentiment_agent'](report_id, "degraded-token")
+            code_audit = await agents['code_audit_agent'](report_id, "degraded-token")
+
+    # The empty first fetches were retried; the complete second ones were reused.
+    assert fetch_social_data.await_count == 2
+    assert fetch_repo_metrics.await_count == 2
+    assert social["status"] == code_audit["status"] == "completed"
+    assert code_audit["data"]["code_audit"]["code_metrics"]["commits_count"] == 10
+
+
+@pytest.mark.asyncio
+async def test_registered_agents_retry_transient_upstream_errors():
+    social_data = [{"source": source, "text": "fine"} for source in ("twitter", "reddit", "news")]
+    fetch_social_data = AsyncMock(side_effect=[httpx.ConnectError("refused"), social_data])
+
+    with patch('backend.app.core.orchestrator.settings.AGENT_CACHE_TTL', 0), \
+         patch('backend.app.core.orchestrator.settings.MIN_RETRY_DELAY', 0), \
+         patch('backend.app.core.orchestrator.settings.MAX_RETRY_DELAY', 0), \
+         patch('backend.app.core.orchestrator.settings.RETRY_MULTIPLIER', 0), \
+         patch('backend.app.core.orchestrator.SocialSentimentAgent.fetch_social_data', fetch_social_data):
+        orch = await create_orchestrator(session_factory=AsyncMock())
+        orch.report_repository.get_report_by_id = AsyncMock(return_value=None)
+        orch.report_repository.update_partial = AsyncMock(return_value=None)
+
+        result = await orch.get_agents()['social_sentiment_agent']("r1", "retry-token")
+
+    assert result["status"] == "completed"
+    assert fetch_social_data.await_count == 2
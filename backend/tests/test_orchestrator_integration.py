@@ -16,6 +16,9 @@ def mock_settings():
         mock_orchestrator_settings.TOKENOMICS_URL = "http://mock-tokenomics.com"
         mock_orchestrator_settings.CODE_AUDIT_REPO_URL = "http://mock-code-audit.com/repo"
         mock_orchestrator_settings.AGENT_TIMEOUT = 5  # Shorter timeout for tests
+        mock_orchestrator_settings.MAX_CONCURRENT_AGENTS = 4
+        mock_orchestrator_settings.AGENT_CACHE_TTL = 0
+        mock_orchestrator_settings.AGENT_MAX_RETRIES = 0
         mock_orchestrator_settings.TEAM_PROFILE_URLS = {SAMPLE_TOKEN_ID: ["http://mock-team-profile.com"]}
         mock_orchestrator_settings.WHITEPAPER_TEXT_SOURCES = {SAMPLE_TOKEN_ID: "mock whitepaper text"}
         yield mock_orchestrator_settings
@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+import pytest
+
+from backend.app.core.rate_limit import HostLimiter
+
+
+@pytest.mark.asyncio
+async def test_host_limiter_spaces_requests_to_the_same_host():
+    limiter = HostLimiter(max_concurrency=4, min_interval=0.05)
+    starts = []
+
+    async def call():
+        async with limiter.acquire("api.example.com"):
+            starts.append(time.monotonic())
+
+    await asyncio.gather(*(call() for _ in range(3)))
+
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert all(gap >= 0.045 for gap in gaps)
+
+
+@pytest.mark.asyncio
+async def test_host_limiter_does_not_delay_other_hosts():
+    limiter = HostLimiter(max_concurrency=1, min_interval=10)
+
+    async with limiter.acquire("slow.example.com"):
+        pass
+
+    await asyncio.wait_for(_enter(limiter, "fast.example.com"), timeout=0.5)
+
+
+@pytest.mark.asyncio
+async def test_host_limiter_bounds_concurrency_per_host():
+    limiter = HostLimiter(max_concurrency=2, min_interval=0)
+    running = 0
+    peak = 0
+
+    async def call():
+        nonlocal running, peak
+        async with limiter.acquire("api.example.com"):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(call() for _ in range(5)))
+
+    assert peak == 2
+
+
+async def _enter(limiter, host):
+    async with limiter.acquire(host):
+        pass
@@ -0,0 +1,256 @@
+import asyncio
+import threading
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.api.v1 import report_download
+from backend.app.core.config import Settings, get_settings
+from backend.app.core.inflight import InflightRequests
+from backend.app.db.database import get_report_repository
+from backend.app.db.models.report_state import ReportState, ReportStatusEnum
+
+REPORT_ID = "report_1"
+REPORT_JSON = {
+    "report_id": REPORT_ID,
+    "metadata": {"token": "ETH"},
+    "sections": [{"title": "Summary", "content": "All good", "agents_output": {"price_agent": "ok"}}],
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_download_state(monkeypatch):
+    monkeypatch.setattr(report_download, "_PDF_INFLIGHT", InflightRequests())
+    report_download._HTML_CACHE.clear()
+    report_download._PDF_STATUS.clear()
+    yield
+    report_download._HTML_CACHE.clear()
+    report_download._PDF_STATUS.clear()
+
+
+@pytest.fixture
+def report_repository():
+    repository = AsyncMock()
+    repository.get_report_by_id.return_value = ReportState(
+        report_id=REPORT_ID, status=ReportStatusEnum.COMPLETED, final_report_json=REPORT_JSON
+    )
+    return repository
+
+
+@pytest.fixture
+def settings(tmp_path):
+    return Settings(REPORT_OUTPUT_DIR=tmp_path)
+
+
+@pytest.fixture
+def client(report_repository, settings):
+    app = FastAPI()
+    app.include_router(report_download.router, prefix="/api/v1")
+    app.dependency_overrides[get_report_repository] = lambda: report_repository
+    app.dependency_overrides[get_settings] = lambda: settings
+    with TestClient(app) as tc:
+        yield tc
+
+
+def test_streamed_html_matches_full_render(client):
+    response = client.get(f"/api/v1/reports/{REPORT_ID}/html")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.text == report_download.render_report_html(REPORT_JSON)
+    assert "".join(report_download.render_report_html_iter(REPORT_JSON)) == report_download.render_report_html(REPORT_JSON)
+
+
+def test_existing_pdf_is_served_as_file(client, settings):
+    (settings.REPORT_OUTPUT_DIR / f"report_{REPORT_ID}.pdf").write_bytes(b"%PDF-1.7 stored")
+
+    response = client.get(f"/api/v1/reports/{REPORT_ID}/pdf")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["content-disposition"] == f'attachment; filename="report_{REPORT_ID}.pdf"'
+    assert "x-accel-redirect" not in response.headers
+    assert response.content == b"%PDF-1.7 stored"
+
+
+def test_existing_pdf_is_handed_off_to_nginx(client, settings):
+    settings.REPORT_X_ACCEL_PREFIX = "/protected/reports/"
+    (settings.REPORT_OUTPUT_DIR / f"report_{REPORT_ID}.pdf").write_bytes(b"%PDF-1.7 stored")
+
+    response = client.get(f"/api/v1/reports/{REPORT_ID}/pdf")
+
+    assert response.status_code == 200
+    assert response.headers["x-accel-redirect"] == f"/protected/reports/report_{REPORT_ID}.pdf"
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["content-disposition"] == f'attachment; filename="report_{REPORT_ID}.pdf"'
+    assert response.content == b""
+
+
+def test_content_disposition_header_value():
+    assert report_download._content_disposition("abc-1", "html") == 'attachment; filename="report_abc-1.html"'
+
+
+@pytest.fixture
+def blocking_render(monkeypatch):
+    """Replaces the WeasyPrint render with one that blocks until released."""
+    release = threading.Event()
+    calls = []
+
+    def render(html_content, pdf_filepath):
+        calls.append(pdf_filepath)
+        release.wait(5)
+        pdf_filepath.write_bytes(b"%PDF-1.7 rendered")
+
+    monkeypatch.setattr(report_download, "_render_pdf", render)
+    return release, calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_pdf_generations_share_one_render(tmp_path, blocking_render):
+    release, calls = blocking_render
+    pdf_filepath = tmp_path / f"report_{REPORT_ID}.pdf"
+
+    first = asyncio.create_task(report_download._generate_pdf(REPORT_ID, REPORT_JSON, pdf_filepath))
+    second = asyncio.create_task(report_download._generate_pdf(REPORT_ID, REPORT_JSON, pdf_filepath))
+    await asyncio.sleep(0.05)
+    release.set()
+
+    assert await first == await second == pdf_filepath
+    assert len(calls) == 1
+    assert REPORT_ID not in report_download._PDF_INFLIGHT._tasks
+
+
+@pytest.mark.asyncio
+async def test_cancelled_pdf_waiter_does_not_abort_shared_render(tmp_path, blocking_render):
+    release, calls = blocking_render
+    pdf_filepath = tmp_path / f"report_{REPORT_ID}.pdf"
+
+    first = asyncio.create_task(report_download._generate_pdf(REPORT_ID, REPORT_JSON, pdf_filepath))
+    second = asyncio.create_task(report_download._generate_pdf(REPORT_ID, REPORT_JSON, pdf_filepath))
+    await asyncio.sleep(0.05)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    release.set()
+
+    assert await second == pdf_filepath
+    assert pdf_filepath.read_bytes() == b"%PDF-1.7 rendered"
+    assert len(calls) == 1
+    assert REPORT_ID not in report_download._PDF_INFLIGHT._tasks
+
+
+def test_pdf_is_queued_then_served_once_rendered(client, settings, monkeypatch):
+    renders = []
+
+    def render(html_content, pdf_filepath):
+        renders.append(pdf_filepath)
+        pdf_filepath.write_bytes(b"%PDF-1.7 rendered")
+
+    monkeypatch.setattr(report_download, "_render_pdf", render)
+
+    # TestClient runs the background render before returning the 202.
+    response = client.get(f"/api/v1/reports/{REPORT_ID}/pdf")
+    assert response.status_code == 202
+    assert response.json() == {"detail": "PDF report is being generated.", "poll": f"/api/v1/reports/{REPORT_ID}/pdf"}
+    assert REPORT_ID not in report_download._PDF_STATUS
+
+    response = client.get(f"/api/v1/reports/{REPORT_ID}/pdf")
+    assert response.status_code == 200
+    assert response.content == b"%PDF-1.7 rendered"
+    assert renders == [settings.REPORT_OUTPUT_DIR / f"report_{REPORT_ID}.pdf"]
+
+
+def test_pdf_poll_while_pending_does_not_queue_another_render(client, monkeypatch):
+    generate = AsyncMock()
+    monkeypatch.setattr(report_download, "_generate_pdf_in_background", generate)
+    report_download._PDF_STATUS[REPORT_ID] = "pending"
+
+    response = client.get(f"/api/v1/reports/{REPORT_ID}/pdf")
+
+    assert response.status_code == 202
+    assert report_download._PDF_STATUS[REPORT_ID] == "pending"
+    generate.assert_not_awaited()
+
+
+def test_pdf_failure_is_reported_then_retried(client, monkeypatch):
+    attempts = []
+
+    def render(html_content, pdf_filepath):
+        attempts.append(pdf_filepath)
+        if len(attempts) == 1:
+            raise RuntimeError("render failed")
+        pdf_filepath.write_bytes(b"%PDF-1.7 rendered")
+
+    monkeypatch.setattr(report_download, "_render_pdf", render)
+
+    response = client.get(f"/api/v1/reports/{REPORT_ID}/pdf")
+    assert response.status_code == 202
+    assert report_download._PDF_STATUS[REPORT_ID] == "failed"
+
+    response = client.get(f"/api/v1/reports/{REPORT_ID}/pdf")
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Failed to generate PDF report"}
+    assert REPORT_ID not in report_download._PDF_STATUS
+
+    # The failure was cleared, so the next request queues a fresh render.
+    response = client.get(f"/api/v1/reports/{REPORT_ID}/pdf")
+    assert response.status_code == 202
+    assert len(attempts) == 2
+
+    response = client.get(f"/api/v1/reports/{REPORT_ID}/pdf")
+    assert response.status_code == 200
+    assert response.content == b"%PDF-1.7 rendered"
+
+
+def test_cached_render_reuses_html_until_content_changes(monkeypatch):
+    render = Mock(side_effect=report_download.render_report_html)
+    monkeypatch.setattr(report_download, "render_report_html", render)
+
+    first = report_download.render_report_html_cached(REPORT_ID, REPORT_JSON)
+    again = report_download.render_report_html_cached(REPORT_ID, dict(REPORT_JSON))
+    assert first == again
+    assert render.call_count == 1
+
+    changed = {**REPORT_JSON, "metadata": {"token": "BTC"}}
+    assert "BTC" in report_download.render_report_html_cached(REPORT_ID, changed)
+    assert render.call_count == 2
+
+
+def test_html_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(report_download, "_HTML_CACHE_MAXSIZE", 2)
+
+    report_download._html_cache_put(("a", "1"), "<a>")
+    report_download._html_cache_put(("b", "1"), "<b>")
+    assert report_download._html_cache_get(("a", "1")) == "<a>"  # "b" is now the oldest
+    report_download._html_cache_put(("c", "1"), "<c>")
+
+    assert report_download._html_cache_get(("b", "1")) is None
+    assert report_download._html_cache_get(("a", "1")) == "<a>"
+    assert report_download._html_cache_get(("c", "1")) == "<c>"
+
+
+def test_stream_is_cached_only_when_fully_sent():
+    key = (REPORT_ID, report_download._report_content_hash(REPORT_JSON))
+
+    aborted = report_download._stream_and_cache(key, REPORT_JSON)
+    next(aborted)
+    aborted.close()  # client disconnected mid-body
+    assert report_download._html_cache_get(key) is None
+
+    body = "".join(report_download._stream_and_cache(key, REPORT_JSON))
+    assert report_download._html_cache_get(key) == body == report_download.render_report_html(REPORT_JSON)
+
+
+def test_html_route_serves_repeat_requests_from_cache(client, monkeypatch):
+    first = client.get(f"/api/v1/reports/{REPORT_ID}/html")
+
+    render_iter = Mock(side_effect=report_download.render_report_html_iter)
+    monkeypatch.setattr(report_download, "render_report_html_iter", render_iter)
+    second = client.get(f"/api/v1/reports/{REPORT_ID}/html")
+
+    assert first.status_code == second.status_code == 200
+    assert second.text == first.text
+    assert second.headers["content-disposition"] == f'attachment; filename="report_{REPORT_ID}.html"'
+    render_iter.assert_not_called()
@@ -0,0 +1,51 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.app.services import report_service
+from backend.app.db.models.report_state import ReportStatusEnum
+
+
+@pytest.fixture(autouse=True)
+def clear_status_cache():
+    report_service._STATUS_CACHE.clear()
+    yield
+    report_service._STATUS_CACHE.clear()
+
+
+def _repository_returning(status: ReportStatusEnum):
+    repository = MagicMock()
+    repository.get_report_state = AsyncMock(return_value=MagicMock(report_id="report_1", status=status))
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_get_report_status_serves_repeated_polls_from_cache():
+    repository = _repository_returning(ReportStatusEnum.RUNNING_AGENTS)
+
+    first = await report_service.get_report_status("report_1", repository)
+    second = await report_service.get_report_status("report_1", repository)
+
+    assert first == second == {"report_id": "report_1", "status": "running_agents"}
+    repository.get_report_state.assert_awaited_once_with("report_1")
+
+
+@pytest.mark.asyncio
+async def test_get_report_status_refetches_after_ttl():
+    repository = _repository_returning(ReportStatusEnum.RUNNING_AGENTS)
+
+    with patch("backend.app.services.report_service.time.monotonic", side_effect=[100.0, 100.5, 102.0, 102.0]):
+        await report_service.get_report_status("report_1", repository)
+        await report_service.get_report_status("report_1", repository)
+        await report_service.get_report_status("report_1", repository)
+
+    assert repository.get_report_state.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_report_status_does_not_cache_missing_reports():
+    repository = MagicMock()
+    repository.get_report_state = AsyncMock(return_value=None)
+
+    assert await report_service.get_report_status("missing", repository) is None
+    assert await report_service.get_report_status("missing", repository) is None
+    assert repository.get_report_state.await_count == 2
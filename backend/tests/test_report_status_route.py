@@ -0,0 +1,56 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.api.v1 import routes
+from backend.app.db.database import get_report_repository
+
+REPORT_ID = "report_1"
+STATUS_URL = f"/api/v1/reports/{REPORT_ID}/status"
+
+
+@pytest.fixture
+def report_status():
+    with patch("backend.app.api.v1.routes.get_report_status", new_callable=AsyncMock) as mock_get_report_status:
+        mock_get_report_status.return_value = {"report_id": REPORT_ID, "status": "running_agents"}
+        yield mock_get_report_status
+
+
+@pytest.fixture
+def client(report_status):
+    app = FastAPI()
+    app.include_router(routes.router, prefix="/api/v1")
+    app.dependency_overrides[get_report_repository] = lambda: AsyncMock()
+    with TestClient(app) as tc:
+        yield tc
+
+
+def test_status_response_carries_weak_etag(client):
+    response = client.get(STATUS_URL)
+
+    assert response.status_code == 200
+    assert response.json() == {"report_id": REPORT_ID, "status": "running_agents"}
+    assert response.headers["etag"] == 'W/"running_agents"'
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_status_matching_if_none_match_returns_304(client):
+    etag = client.get(STATUS_URL).headers["etag"]
+
+    response = client.get(STATUS_URL, headers={"If-None-Match": f'W/"pending", {etag}'})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_status_change_returns_200_with_new_etag(client, report_status):
+    etag = client.get(STATUS_URL).headers["etag"]
+    report_status.return_value = {"report_id": REPORT_ID, "status": "completed"}
+
+    response = client.get(STATUS_URL, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json() == {"report_id": REPORT_ID, "status": "completed"}
+    assert response.headers["etag"] == 'W/"completed"'
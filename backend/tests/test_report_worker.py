@@ -0,0 +1,67 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from arq import Retry
+
+from backend.app.core import storage
+from backend.app.workers import report_worker
+
+
+@pytest.mark.asyncio
+async def test_enqueue_uses_shared_pool():
+    mock_pool = AsyncMock()
+    with patch("backend.app.workers.report_worker.create_pool", new_callable=AsyncMock, return_value=mock_pool) as mock_create_pool:
+        await report_worker.enqueue("run_report_pipeline", "report_1", "token_1")
+        await report_worker.enqueue("run_report_pipeline", "report_2", "token_2")
+        await report_worker.close_pool()
+
+    mock_create_pool.assert_awaited_once()
+    mock_pool.enqueue_job.assert_any_await("run_report_pipeline", "report_1", "token_1")
+    mock_pool.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_run_report_pipeline_retries_with_backoff():
+    with patch("backend.app.workers.report_worker.process_report", new_callable=AsyncMock, side_effect=RuntimeError("boom")), \
+         patch("backend.app.workers.report_worker.ReportRepository") as mock_repository_cls, \
+         patch("backend.app.workers.report_worker._mark_failed", new_callable=AsyncMock) as mock_mark_failed:
+        mock_repository_cls.return_value.update_report_status = AsyncMock()
+
+        with pytest.raises(Retry):
+            await report_worker.run_report_pipeline({"job_try": 1}, "report_1", "token_1")
+        mock_mark_failed.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_run_report_pipeline_marks_failed_after_last_attempt():
+    with patch("backend.app.workers.report_worker.process_report", new_callable=AsyncMock, side_effect=RuntimeError("boom")), \
+         patch("backend.app.workers.report_worker.ReportRepository") as mock_repository_cls, \
+         patch("backend.app.workers.report_worker._mark_failed", new_callable=AsyncMock) as mock_mark_failed:
+        mock_repository_cls.return_value.update_report_status = AsyncMock()
+
+        await report_worker.run_report_pipeline({"job_try": report_worker.settings.MAX_RETRIES}, "report_1", "token_1")
+        mock_mark_failed.assert_awaited_once_with("report_1", "boom")
+
+
+def test_retry_delay_is_capped():
+    assert report_worker._retry_delay(1) >= report_worker.settings.MIN_RETRY_DELAY
+    assert report_worker._retry_delay(50) == report_worker.settings.MAX_RETRY_DELAY
+
+
+
+@pytest.mark.asyncio
+async def test_run_report_pipeline_duplicate_keeps_running_claim():
+    report_id = "report_dup"
+    # Another job is still running this report and holds the claim.
+    assert storage.try_set_processing(report_id)
+    try:
+        with patch("backend.app.workers.report_worker.ReportRepository") as mock_repository_cls, \
+             patch("backend.app.workers.report_worker._mark_failed", new_callable=AsyncMock) as mock_mark_failed:
+            mock_repository_cls.return_value.update_report_status = AsyncMock()
+
+            await report_worker.run_report_pipeline({"job_try": 1}, report_id, "token_1")
+
+            mock_mark_failed.assert_not_awaited()
+        assert storage.get_report_status(report_id) == "processing"
+        assert not storage.try_set_processing(report_id)
+    finally:
+        storage.REPORT_STORE.pop(report_id, None)
@@ -0,0 +1,38 @@
+import pytest
+
+from backend.app.core import storage
+
+
+@pytest.fixture(autouse=True)
+def clear_store():
+    storage.REPORT_STORE.clear()
+    yield
+    storage.REPORT_STORE.clear()
+
+
+def test_set_and_get_report_status():
+    assert storage.get_report_status("report_1") is None
+
+    storage.set_report_status("report_1", "queued")
+    storage.set_report_status("report_1", "failed")
+
+    assert storage.get_report_status("report_1") == "failed"
+    assert storage.REPORT_STORE["report_1"]["data"] is None
+
+
+def test_try_set_processing_claims_report_once():
+    assert storage.try_set_processing("report_1") is True
+    assert storage.try_set_processing("report_1") is False
+
+    storage.set_report_status("report_1", "failed")
+
+    assert storage.try_set_processing("report_1") is True
+
+
+def test_save_report_data_keeps_status_unless_asked():
+    storage.save_report_data("report_1", {"score": 1})
+    assert storage.get_report_status("report_1") == "processing"
+
+    storage.save_report_data("report_1", {"text": "done"}, key="final", update_status=True)
+
+    assert storage.REPORT_STORE["report_1"] == {"status": "completed", "data": {"score": 1}, "final": {"text": "done"}}